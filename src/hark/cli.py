@@ -1,15 +1,23 @@
 """Main CLI entry point for hark."""
 
 import argparse
+import codecs
+import functools
+import os
 import sys
-import time
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import numpy as np
-
+# Heavy modules (numpy, sounddevice, soundfile, whisper) are imported inside
+# the workflow helpers so that --help, --version and argument errors stay fast.
 if TYPE_CHECKING:
+    import numpy as np
+
     from hark.diarizer import DiarizationResult
+    from hark.recorder import AudioRecorder
+    from hark.transcriber import Transcriber, TranscriptionResult
 
 __all__ = [
     "create_parser",
@@ -31,20 +39,14 @@ from hark.constants import (
     EXIT_INTERRUPT,
     EXIT_SUCCESS,
     MIN_RECORDING_DURATION,
+    RECORDING_UI_REFRESH_INTERVAL,
     VALID_MODELS,
     VALID_OUTPUT_FORMATS,
 )
 from hark.exceptions import DependencyMissingError, HarkError, MissingTokenError
-from hark.formatter import get_formatter
 from hark.keypress import KeypressHandler
-from hark.preprocessor import AudioPreprocessor
-from hark.recorder import AudioRecorder
-from hark.transcriber import Transcriber, TranscriptionResult
 from hark.ui import UI
 
-# Type alias for results
-FormattableResult = TranscriptionResult
-
 
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
@@ -99,6 +101,11 @@ Examples:
         metavar="NUM",
         help="Audio channels (default: 1)",
     )
+    recording.add_argument(
+        "--auto-stop",
+        action="store_true",
+        help="Stop recording automatically on silence after speech",
+    )
 
     # Language options
     language = parser.add_argument_group("Language Options")
@@ -154,6 +161,11 @@ Examples:
         action="store_true",
         help="Append to output file instead of overwriting",
     )
+    output.add_argument(
+        "--events",
+        metavar="FILE",
+        help="Append transcription progress as JSON Lines to FILE (replaces progress bar)",
+    )
 
     # Interface options
     interface = parser.add_argument_group("Interface Options")
@@ -204,6 +216,18 @@ Examples:
     return parser
 
 
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """
+    Get the parser used by main(), built once per process.
+
+    parse_args() does not mutate the parser, so repeated main() calls (e.g.
+    batch use as a library) can share it. create_parser() still returns a
+    fresh parser for callers that want to extend it.
+    """
+    return create_parser()
+
+
 def _validate_diarization_args(args: argparse.Namespace, config: HarkConfig, ui: UI) -> bool:
     """
     Validate diarization-related arguments.
@@ -255,7 +279,8 @@ def _wait_for_start_signal(ui: UI) -> bool:
     try:
         with KeypressHandler() as keys:
             while True:
-                key = keys.get_key(timeout=0.1)
+                # Block until a key arrives instead of polling
+                key = keys.get_key(timeout=None)
                 if key == " ":
                     return True
                 elif key == "\x03":  # Ctrl+C
@@ -265,7 +290,9 @@ def _wait_for_start_signal(ui: UI) -> bool:
         return False
 
 
-def _record_audio(ui: UI, config: HarkConfig) -> tuple[Path, float] | None:
+def _record_audio(
+    ui: UI, config: HarkConfig
+) -> "tuple[AudioRecorder, Path | np.ndarray, float] | None":
     """
     Record audio from microphone.
 
@@ -274,8 +301,12 @@ def _record_audio(ui: UI, config: HarkConfig) -> tuple[Path, float] | None:
         config: Application configuration.
 
     Returns:
-        Tuple of (audio_path, duration) or None if interrupted too early.
+        Tuple of (recorder, recording, duration) or None if interrupted too
+        early. The recording is a temp file path, or the samples when kept in
+        memory; call recorder.release() once it is no longer needed.
     """
+    from hark.recorder import AudioRecorder, energy_vad
+
     # Set up level tracking for UI
     current_level = [0.0]
 
@@ -289,6 +320,15 @@ def _record_audio(ui: UI, config: HarkConfig) -> tuple[Path, float] | None:
         level_callback=level_callback,
         temp_dir=config.temp_directory,
         input_source=config.recording.input_source,
+        in_memory=True,
+        # Oversized recordings spill to an unnamed file that a crash can't leak
+        anonymous_file=True,
+        # Reuse the silence-trimming threshold to tell speech from silence
+        vad=(
+            energy_vad(config.preprocessing.silence_trimming.threshold_db)
+            if config.recording.auto_stop
+            else None
+        ),
     )
 
     ui.info("")  # New line after prompt
@@ -304,36 +344,45 @@ def _record_audio(ui: UI, config: HarkConfig) -> tuple[Path, float] | None:
                     level=current_level[0],
                     input_source=config.recording.input_source,
                 )
-                time.sleep(0.05)
-                keys.get_key(timeout=0.01)
+                # Sleep until the recorder stops (max duration) or the next redraw
+                recorder.wait_until_stopped(timeout=RECORDING_UI_REFRESH_INTERVAL)
+            # Discard keys typed while recording
+            keys.flush_input()
     except KeyboardInterrupt:
         pass  # Normal stop via Ctrl+C
 
-    audio_path = recorder.stop()
+    try:
+        recording = recorder.stop()
+    except BaseException:
+        # run_workflow only releases recordings it receives
+        recorder.release()
+        raise
     duration = recorder.get_duration()
     ui.recording_stopped(duration)
 
-    return audio_path, duration
+    return recorder, recording, duration
 
 
 def _preprocess_audio(
     ui: UI,
     config: HarkConfig,
-    audio_path: Path,
+    audio_path: "Path | np.ndarray",
     preserve_stereo: bool = False,
-) -> tuple[np.ndarray, float]:
+) -> "tuple[np.ndarray, float]":
     """
     Preprocess recorded audio.
 
     Args:
         ui: UI handler.
         config: Application configuration.
-        audio_path: Path to audio file.
+        audio_path: Path to audio file, or in-memory recorded samples.
         preserve_stereo: If True, preserve stereo channels for diarization.
 
     Returns:
         Tuple of (processed_audio, silence_trimmed_seconds).
     """
+    from hark.preprocessor import AudioPreprocessor
+
     ui.preprocessing_header()
 
     preprocessor = AudioPreprocessor(config.preprocessing)
@@ -343,32 +392,32 @@ def _preprocess_audio(
         preserve_stereo=preserve_stereo,
     )
 
+    steps = []
     if config.preprocessing.noise_reduction.enabled:
-        ui.preprocessing_step("Noise reduction applied")
+        steps.append("Noise reduction applied")
     if config.preprocessing.normalization.enabled:
-        ui.preprocessing_step("Audio normalized")
+        steps.append("Audio normalized")
     if config.preprocessing.silence_trimming.enabled:
         trimmed = preprocess_result.silence_trimmed_seconds
-        ui.preprocessing_step(f"Silence trimmed ({trimmed:.1f}s removed)")
+        steps.append(f"Silence trimmed ({trimmed:.1f}s removed)")
+    ui.preprocessing_steps(steps)
 
     return processed_audio, preprocess_result.silence_trimmed_seconds
 
 
-def _transcribe_audio(ui: UI, config: HarkConfig, audio: np.ndarray) -> TranscriptionResult:
+def _create_transcriber(config: HarkConfig) -> "Transcriber":
     """
-    Load model and transcribe audio.
+    Create a transcriber from configuration (model is not loaded yet).
 
     Args:
-        ui: UI handler.
         config: Application configuration.
-        audio: Processed audio data.
 
     Returns:
-        Transcription result.
+        Transcriber instance.
     """
-    ui.info(f"\nLoading Whisper model '{config.whisper.model}'...")
+    from hark.transcriber import Transcriber
 
-    transcriber = Transcriber(
+    return Transcriber(
         model_name=config.whisper.model,
         device=config.whisper.device,
         model_cache_dir=config.model_cache_dir,
@@ -376,27 +425,91 @@ def _transcribe_audio(ui: UI, config: HarkConfig, audio: np.ndarray) -> Transcri
         vad_filter=config.whisper.vad_filter,
         vad_min_silence_ms=config.whisper.vad_min_silence_ms,
     )
-    transcriber.load_model()
+
+
+def _start_model_load(config: HarkConfig) -> "tuple[Transcriber, Future[None]]":
+    """
+    Create a transcriber and start loading its model on a background thread.
+
+    Model loading is disk-bound and independent of preprocessing, so running
+    it concurrently hides most of the load time. The loader runs on a daemon
+    thread so an aborted run (Ctrl+C, preprocessing error) exits immediately
+    instead of waiting for the load to finish.
+
+    Args:
+        config: Application configuration.
+
+    Returns:
+        Tuple of (transcriber, future that completes when the model is loaded).
+    """
+    transcriber = _create_transcriber(config)
+    model_loaded: Future[None] = Future()
+
+    def load() -> None:
+        if not model_loaded.set_running_or_notify_cancel():
+            return
+        try:
+            transcriber.load_model()
+        except BaseException as e:
+            model_loaded.set_exception(e)
+        else:
+            model_loaded.set_result(None)
+
+    threading.Thread(target=load, name="hark-model-load", daemon=True).start()
+    return transcriber, model_loaded
+
+
+def _transcribe_audio(
+    ui: UI,
+    config: HarkConfig,
+    audio: "np.ndarray",
+    transcriber: "Transcriber",
+    model_loaded: "Future[None]",
+) -> "TranscriptionResult":
+    """
+    Wait for the model to load and transcribe audio.
+
+    Args:
+        ui: UI handler.
+        config: Application configuration.
+        audio: Processed audio data.
+        transcriber: Transcriber whose model is loading in the background.
+        model_loaded: Future for the background load_model() call.
+
+    Returns:
+        Transcription result.
+    """
+    ui.info(f"\nLoading Whisper model '{config.whisper.model}'...")
+    model_loaded.result()  # Re-raises any model load error
     ui.info("Model loaded.")
 
     ui.info("\nTranscribing audio...")
 
-    def progress_callback(progress: float) -> None:
-        ui.transcription_progress(progress)
-
     language = config.whisper.language if config.whisper.language != "auto" else None
-    return transcriber.transcribe(
-        audio=audio,
-        sample_rate=config.recording.sample_rate,
-        language=language,
-        progress_callback=progress_callback,
-    )
+    if config.output.events_path is None:
+        return transcriber.transcribe(
+            audio=audio,
+            sample_rate=config.recording.sample_rate,
+            language=language,
+            progress_callback=ui.transcription_progress,
+        )
+
+    # Progress goes to the events file instead of the terminal
+    from hark.events import ProgressEventLog
+
+    with ProgressEventLog(config.output.events_path) as events:
+        return transcriber.transcribe(
+            audio=audio,
+            sample_rate=config.recording.sample_rate,
+            language=language,
+            progress_callback=events.emit,
+        )
 
 
 def _diarize_audio(
     ui: UI,
     config: HarkConfig,
-    audio: np.ndarray,
+    audio: "np.ndarray",
     num_speakers: int | None = None,
 ) -> "DiarizationResult":
     """
@@ -436,7 +549,7 @@ def _diarize_audio(
 def _process_stereo_diarization(
     ui: UI,
     config: HarkConfig,
-    audio: np.ndarray,
+    audio: "np.ndarray",
     num_speakers: int | None = None,
 ) -> "DiarizationResult":
     """
@@ -467,6 +580,14 @@ def _process_stereo_diarization(
     )
 
 
+def _to_platform_newlines(text: str) -> str:
+    """Apply the newline translation a text-mode stream would on this platform."""
+    # Byte writes skip TextIOWrapper's translation; keep the platform line endings
+    if os.linesep != "\n":
+        return text.replace("\n", os.linesep)
+    return text
+
+
 def _write_output(
     ui: UI,
     config: HarkConfig,
@@ -482,23 +603,47 @@ def _write_output(
         result: Transcription result.
         output_file: Output file path (None for stdout).
     """
+    from hark.formatter import get_formatter
+
     formatter = get_formatter(
         format_name=config.output.format,
         include_timestamps=config.output.timestamps,
     )
-    output_text = formatter.format(result)
 
     if output_file:
         output_path = Path(output_file)
-        mode = "a" if config.output.append_mode else "w"
-        with output_path.open(mode, encoding=config.output.encoding) as f:
-            f.write(output_text)
-            if config.output.append_mode:
-                f.write("\n")
+        payload = formatter.format(result)
+        if config.output.append_mode:
+            payload += "\n"
+        payload = _to_platform_newlines(payload)
+        # Encode once and write pre-encoded bytes, bypassing TextIOWrapper
+        mode = "ab" if config.output.append_mode else "wb"
+        encoder = codecs.getincrementalencoder(config.output.encoding)()
+        with output_path.open(mode) as f:
+            if f.tell() > 0:
+                # Like TextIOWrapper: no BOM (utf-16, utf-8-sig) mid-file
+                encoder.setstate(0)
+            f.write(encoder.encode(payload, final=True))
         ui.transcription_complete(result, str(output_path))
     else:
         ui.info("")  # New line before output
-        print(output_text)
+        payload = formatter.format(result) + "\n"
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        if stdout_buffer is None:
+            # Replaced stdout without a byte layer (e.g. StringIO)
+            sys.stdout.write(payload)
+        else:
+            # One encoded write instead of print()'s text and separator writes,
+            # using the stream's own encoding and error handler so the bytes
+            # match what print() would have produced; flush first so it lands
+            # after anything already printed
+            encoded = _to_platform_newlines(payload).encode(
+                getattr(sys.stdout, "encoding", None) or config.output.encoding,
+                getattr(sys.stdout, "errors", None) or "strict",
+            )
+            sys.stdout.flush()
+            stdout_buffer.write(encoded)
+            stdout_buffer.flush()
         if not config.interface.quiet:
             ui.transcription_complete(result, None)
 
@@ -540,55 +685,61 @@ def run_workflow(
     if recording_result is None:
         return EXIT_INTERRUPT
 
-    audio_path, duration = recording_result
+    recorder, recording, duration = recording_result
 
-    # Check minimum duration
-    if duration < MIN_RECORDING_DURATION:
-        ui.error(f"Recording too short ({duration:.1f}s < {MIN_RECORDING_DURATION}s)")
-        return EXIT_ERROR
+    try:
+        # Check minimum duration
+        if duration < MIN_RECORDING_DURATION:
+            ui.error(f"Recording too short ({duration:.1f}s < {MIN_RECORDING_DURATION}s)")
+            return EXIT_ERROR
 
-    # Preprocess audio
-    # Preserve stereo if diarizing with --input both (need separate channels)
-    preserve_stereo = diarize and config.recording.input_source == "both"
-    processed_audio, _ = _preprocess_audio(ui, config, audio_path, preserve_stereo=preserve_stereo)
-
-    # Transcribe or diarize
-    result: TranscriptionResult | DiarizationResult
-    if diarize:
-        if config.recording.input_source == "both":
-            # Stereo mode: process channels separately
-            result = _process_stereo_diarization(ui, config, processed_audio, num_speakers)
-        else:
-            # Mono mode (speaker input): diarize directly
-            result = _diarize_audio(ui, config, processed_audio, num_speakers)
-
-        # Show speaker summary
-        ui.info(f"\nDetected {len(result.speakers)} speaker(s): {', '.join(result.speakers)}")
-
-        # Interactive speaker naming (unless --no-interactive)
-        if not no_interactive:
-            from hark.interactive import interactive_speaker_naming
-
-            local_speaker = config.diarization.local_speaker_name or DEFAULT_LOCAL_SPEAKER
-            result = interactive_speaker_naming(
-                result,
-                quiet=config.interface.quiet,
-                local_speaker_name=local_speaker,
-                ui=ui,
-            )
-    else:
-        result = _transcribe_audio(ui, config, processed_audio)
+        # Start loading the Whisper model so it overlaps with preprocessing
+        # (diarization backends load their own models)
+        model_load = None if diarize else _start_model_load(config)
 
-    # Write output
-    _write_output(ui, config, result, output_file)
+        # Preprocess audio
+        # Preserve stereo if diarizing with --input both (need separate channels)
+        preserve_stereo = diarize and config.recording.input_source == "both"
+        processed_audio, _ = _preprocess_audio(
+            ui, config, recording, preserve_stereo=preserve_stereo
+        )
 
-    # Cleanup temp file
-    try:
-        audio_path.unlink()
-        if verbose:
-            ui.verbose(f"Cleaned up temp file: {audio_path}")
-    except OSError:
-        pass
+        # Transcribe or diarize
+        result: TranscriptionResult | DiarizationResult
+        if diarize:
+            if config.recording.input_source == "both":
+                # Stereo mode: process channels separately
+                result = _process_stereo_diarization(ui, config, processed_audio, num_speakers)
+            else:
+                # Mono mode (speaker input): diarize directly
+                result = _diarize_audio(ui, config, processed_audio, num_speakers)
+
+            # Show speaker summary
+            ui.info(f"\nDetected {len(result.speakers)} speaker(s): {', '.join(result.speakers)}")
+
+            # Interactive speaker naming (unless --no-interactive)
+            if not no_interactive:
+                from hark.interactive import interactive_speaker_naming
+
+                local_speaker = config.diarization.local_speaker_name or DEFAULT_LOCAL_SPEAKER
+                result = interactive_speaker_naming(
+                    result,
+                    quiet=config.interface.quiet,
+                    local_speaker_name=local_speaker,
+                    ui=ui,
+                )
+        else:
+            assert model_load is not None  # for type checker: started when not diarizing
+            transcriber, model_loaded = model_load
+            result = _transcribe_audio(ui, config, processed_audio, transcriber, model_loaded)
+
+        # Write output
+        _write_output(ui, config, result, output_file)
+    finally:
+        # Close or delete the temp file (in-memory recordings have none)
+        recorder.release()
+        if verbose and isinstance(recording, Path):
+            ui.verbose(f"Cleaned up temp file: {recording}")
 
     return EXIT_SUCCESS
 
@@ -603,7 +754,7 @@ def main(argv: list[str] | None = None) -> int:
     Returns:
         Exit code.
     """
-    parser = create_parser()
+    parser = _get_parser()
     args = parser.parse_args(argv)
 
     # Initialize UI early for error reporting
@@ -618,8 +769,7 @@ def main(argv: list[str] | None = None) -> int:
         # Validate config
         errors = validate_config(config)
         if errors:
-            for error in errors:
-                ui.error(error)
+            ui.errors(errors)
             return EXIT_ERROR
 
         # Validate diarization args
@@ -63,6 +63,7 @@ class RecordingConfig:
     channels: int = DEFAULT_CHANNELS
     max_duration: int = DEFAULT_MAX_DURATION
     input_source: str = DEFAULT_INPUT_SOURCE
+    auto_stop: bool = False  # Stop automatically on silence after speech
 
 
 @dataclass
@@ -119,6 +120,7 @@ class OutputConfig:
     timestamps: bool = False
     append_mode: bool = False
     encoding: str = DEFAULT_ENCODING
+    events_path: Path | None = None  # JSON Lines progress events
 
 
 @dataclass
@@ -170,6 +172,7 @@ def _dict_to_config(data: dict[str, Any]) -> HarkConfig:
             channels=rec.get("channels", DEFAULT_CHANNELS),
             max_duration=rec.get("max_duration", DEFAULT_MAX_DURATION),
             input_source=rec.get("input_source", DEFAULT_INPUT_SOURCE),
+            auto_stop=rec.get("auto_stop", False),
         )
 
     if "whisper" in data:
@@ -212,6 +215,7 @@ def _dict_to_config(data: dict[str, Any]) -> HarkConfig:
             timestamps=o.get("timestamps", False),
             append_mode=o.get("append_mode", False),
             encoding=o.get("encoding", DEFAULT_ENCODING),
+            events_path=Path(o["events_path"]).expanduser() if o.get("events_path") else None,
         )
 
     if "interface" in data:
@@ -297,6 +301,8 @@ def merge_cli_args(config: HarkConfig, args: argparse.Namespace) -> HarkConfig:
         config.recording.channels = args.channels
     if getattr(args, "input_source", None) is not None:
         config.recording.input_source = args.input_source
+    if getattr(args, "auto_stop", False):
+        config.recording.auto_stop = True
 
     # Auto-set channels to 2 when using 'both' input source (stereo required)
     if config.recording.input_source == "both" and getattr(args, "channels", None) is None:
@@ -325,6 +331,8 @@ def merge_cli_args(config: HarkConfig, args: argparse.Namespace) -> HarkConfig:
         config.output.format = args.format
     if getattr(args, "append", False):
         config.output.append_mode = True
+    if getattr(args, "events", None) is not None:
+        config.output.events_path = Path(args.events)
 
     # Interface options
     if getattr(args, "quiet", False):
@@ -435,6 +443,7 @@ recording:
   channels: 1
   max_duration: 600  # 10 minutes
   input_source: mic  # mic, speaker, or both
+  auto_stop: false  # stop on silence after speech (same as --auto-stop)
 
 # Whisper Model Settings
 whisper:
@@ -466,6 +475,7 @@ output:
   timestamps: false
   append_mode: false
   encoding: utf-8
+  # events_path: ~/hark-events.jsonl  # JSON Lines progress events (same as --events)
 
 # Interface Settings
 interface:
@@ -9,6 +9,8 @@ __all__ = [
     "DEFAULT_SAMPLE_RATE",
     "DEFAULT_CHANNELS",
     "DEFAULT_BIT_DEPTH",
+    "DEFAULT_WAV_SUBTYPE",
+    "MAX_IN_MEMORY_RECORDING_BYTES",
     "DEFAULT_MAX_DURATION",
     "DEFAULT_BUFFER_SIZE",
     "DEFAULT_INPUT_SOURCE",
@@ -39,13 +41,18 @@ __all__ = [
     "EXIT_ERROR",
     "EXIT_INTERRUPT",
     "MIN_RECORDING_DURATION",
+    "RECORDING_UI_REFRESH_INTERVAL",
+    "PROGRESS_EVENT_MIN_INTERVAL",
 ]
 
 # Audio recording defaults
 DEFAULT_SAMPLE_RATE = 16000  # Whisper's expected sample rate
 DEFAULT_CHANNELS = 1
 DEFAULT_BIT_DEPTH = 16
+DEFAULT_WAV_SUBTYPE = "PCM_16"  # Recording file subtype; float input is quantized on write
 DEFAULT_MAX_DURATION = 600  # 10 minutes
+# Recordings up to this size are kept in memory instead of a temp WAV file
+MAX_IN_MEMORY_RECORDING_BYTES = 256 * 1024 * 1024
 DEFAULT_BUFFER_SIZE = 4096
 DEFAULT_INPUT_SOURCE = "mic"
 VALID_INPUT_SOURCES = ["mic", "speaker", "both"]
@@ -108,3 +115,9 @@ EXIT_INTERRUPT = 130  # Standard exit code for Ctrl+C
 
 # Minimum recording duration (seconds)
 MIN_RECORDING_DURATION = 0.5
+
+# Recording status redraw interval (seconds)
+RECORDING_UI_REFRESH_INTERVAL = 0.25
+
+# Minimum interval between progress events written to the events file (seconds)
+PROGRESS_EVENT_MIN_INTERVAL = 0.1
@@ -0,0 +1,76 @@
+"""Machine-readable progress events for hark."""
+
+import json
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import TextIO
+
+from hark.constants import PROGRESS_EVENT_MIN_INTERVAL
+
+__all__ = ["ProgressEventLog"]
+
+
+class ProgressEventLog:
+    """
+    Appends progress updates to a JSON Lines file.
+
+    Each line is {"ts": <unix time>, "progress": <0.0-1.0>}. Updates are
+    throttled to at most one per PROGRESS_EVENT_MIN_INTERVAL seconds, except
+    that completion (progress >= 1.0) is always written. Other tools can
+    tail the file instead of scraping the terminal progress bar.
+
+    Example:
+        with ProgressEventLog(path) as events:
+            transcriber.transcribe(audio, progress_callback=events.emit)
+    """
+
+    def __init__(self, path: Path, min_interval: float = PROGRESS_EVENT_MIN_INTERVAL) -> None:
+        """
+        Initialize the event log.
+
+        Args:
+            path: JSON Lines file to append to.
+            min_interval: Minimum seconds between written events.
+        """
+        self._path = path
+        self._min_interval = min_interval
+        self._file: TextIO | None = None
+        self._last_emit: float | None = None
+
+    def __enter__(self) -> "ProgressEventLog":
+        """Open the events file for appending (line buffered)."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._path.open("a", buffering=1, encoding="utf-8")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the events file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def emit(self, progress: float) -> None:
+        """
+        Write a progress event unless one was written too recently.
+
+        Args:
+            progress: Progress value (0.0-1.0).
+        """
+        if self._file is None:
+            return
+
+        now = time.monotonic()
+        if (
+            progress < 1.0
+            and self._last_emit is not None
+            and now - self._last_emit < self._min_interval
+        ):
+            return
+        self._last_emit = now
+        self._file.write(json.dumps({"ts": time.time(), "progress": progress}) + "\n")
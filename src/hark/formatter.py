@@ -1,9 +1,12 @@
 """Output formatters for hark."""
 
+import io
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import TextIO
 
 from hark.constants import UNKNOWN_LANGUAGE_PROBABILITY
-from hark.diarizer import DiarizationResult
+from hark.diarizer import DiarizationResult, DiarizedSegment
 from hark.transcriber import TranscriptionResult
 
 __all__ = [
@@ -19,6 +22,16 @@ class OutputFormatter(ABC):
     """Base class for output formatters."""
 
     @abstractmethod
+    def format_to(self, result: TranscriptionResult | DiarizationResult, fp: TextIO) -> None:
+        """
+        Write formatted transcription or diarization result to a text stream.
+
+        Args:
+            result: Transcription or diarization result to format.
+            fp: Text stream to write to.
+        """
+        pass
+
     def format(self, result: TranscriptionResult | DiarizationResult) -> str:
         """
         Format transcription or diarization result to string.
@@ -29,7 +42,9 @@ class OutputFormatter(ABC):
         Returns:
             Formatted string.
         """
-        pass
+        buf = io.StringIO()
+        self.format_to(result, buf)
+        return buf.getvalue()
 
     def _is_diarization_result(self, result: TranscriptionResult | DiarizationResult) -> bool:
         """Check if result is a DiarizationResult."""
@@ -48,52 +63,46 @@ class PlainFormatter(OutputFormatter):
         """
         self._include_timestamps = include_timestamps
 
-    def format(self, result: TranscriptionResult | DiarizationResult) -> str:
-        """Format as plain text."""
+    def format_to(self, result: TranscriptionResult | DiarizationResult, fp: TextIO) -> None:
+        """Write as plain text."""
         if self._is_diarization_result(result):
-            return self._format_diarization(result)  # type: ignore[arg-type]
-        return self._format_transcription(result)  # type: ignore[arg-type]
+            self._format_diarization(result, fp)  # type: ignore[arg-type]
+        else:
+            self._format_transcription(result, fp)  # type: ignore[arg-type]
 
-    def _format_transcription(self, result: TranscriptionResult) -> str:
-        """Format transcription result."""
+    def _format_transcription(self, result: TranscriptionResult, fp: TextIO) -> None:
+        """Write transcription result."""
         if not self._include_timestamps:
-            return result.text
-
-        lines: list[str] = []
-        for segment in result.segments:
-            timestamp = f"[{self._format_time(segment.start)} --> {self._format_time(segment.end)}]"
-            lines.append(f"{timestamp} {segment.text}")
-
-        return "\n".join(lines)
+            fp.write(result.text)
+            return
+
+        # Bind the helper locally so the per-segment loop skips attribute lookups
+        fmt_time = self._format_time
+        fp.write(
+            "\n".join(
+                f"[{fmt_time(s.start)} --> {fmt_time(s.end)}] {s.text}" for s in result.segments
+            )
+        )
 
-    def _format_diarization(self, result: DiarizationResult) -> str:
-        """Format diarization result with speaker labels."""
-        lines: list[str] = []
-
-        for segment in result.segments:
-            speaker = segment.speaker
+    def _format_diarization(self, result: DiarizationResult, fp: TextIO) -> None:
+        """Write diarization result with speaker labels."""
+        fmt_time = self._format_time_short
+        include_timestamps = self._include_timestamps
 
+        def format_line(segment: DiarizedSegment) -> str:
+            timestamp = f"[{fmt_time(segment.start)}] " if include_timestamps else ""
             # Handle overlapping speakers (e.g., "SPEAKER_01 + SPEAKER_02")
-            if self._include_timestamps:
-                timestamp = self._format_time_short(segment.start)
-                if " + " in speaker:
-                    lines.append(f"[{timestamp}] [{speaker}] [overlapping] {segment.text}")
-                else:
-                    lines.append(f"[{timestamp}] [{speaker}] {segment.text}")
-            else:
-                if " + " in speaker:
-                    lines.append(f"[{speaker}] [overlapping] {segment.text}")
-                else:
-                    lines.append(f"[{speaker}] {segment.text}")
+            overlap = " [overlapping]" if " + " in segment.speaker else ""
+            return f"{timestamp}[{segment.speaker}]{overlap} {segment.text}"
 
-        return "\n".join(lines)
+        fp.write("\n".join(map(format_line, result.segments)))
 
     @staticmethod
     def _format_time(seconds: float) -> str:
         """Format seconds as MM:SS.mmm"""
-        mins = int(seconds // 60)
-        secs = seconds % 60
-        return f"{mins:02d}:{secs:06.3f}"
+        secs, ms = divmod(round(seconds * 1000), 1000)
+        mins, secs = divmod(secs, 60)
+        return f"{mins:02d}:{secs:02d}.{ms:03d}"
 
     @staticmethod
     def _format_time_short(seconds: float) -> str:
@@ -118,24 +127,22 @@ class MarkdownFormatter(OutputFormatter):
         """
         self._include_timestamps = include_timestamps
 
-    def format(self, result: TranscriptionResult | DiarizationResult) -> str:
-        """Format as markdown."""
+    def format_to(self, result: TranscriptionResult | DiarizationResult, fp: TextIO) -> None:
+        """Write as markdown."""
         if self._is_diarization_result(result):
-            return self._format_diarization(result)  # type: ignore[arg-type]
-        return self._format_transcription(result)  # type: ignore[arg-type]
+            self._format_diarization(result, fp)  # type: ignore[arg-type]
+        else:
+            self._format_transcription(result, fp)  # type: ignore[arg-type]
 
-    def _format_transcription(self, result: TranscriptionResult) -> str:
-        """Format transcription result."""
-        lines = ["# Transcription", ""]
+    def _format_transcription(self, result: TranscriptionResult, fp: TextIO) -> None:
+        """Write transcription result."""
+        fp.write("# Transcription\n\n")
 
         if self._include_timestamps:
-            for segment in result.segments:
-                timestamp = self._format_time(segment.start)
-                lines.append(f"**[{timestamp}]** {segment.text}")
-                lines.append("")
+            fmt_time = self._format_time
+            fp.write("".join(f"**[{fmt_time(s.start)}]** {s.text}\n\n" for s in result.segments))
         else:
-            lines.append(result.text)
-            lines.append("")
+            fp.write(f"{result.text}\n\n")
 
         # Add metadata footer
         # Handle unknown language probability (from diarization backends)
@@ -145,56 +152,53 @@ class MarkdownFormatter(OutputFormatter):
             lang_str = (
                 f"*Language: {result.language} ({result.language_probability:.0%} confidence)*  "
             )
-        lines.extend(
-            [
-                "---",
-                "",
-                lang_str,
-                f"*Duration: {result.duration:.1f}s*",
-            ]
-        )
+        fp.write(f"---\n\n{lang_str}\n*Duration: {result.duration:.1f}s*")
 
-        return "\n".join(lines)
-
-    def _format_diarization(self, result: DiarizationResult) -> str:
-        """Format diarization result with speaker labels."""
-        lines = ["# Meeting Transcript", ""]
+    def _format_diarization(self, result: DiarizationResult, fp: TextIO) -> None:
+        """Write diarization result with speaker labels."""
+        fp.write("# Meeting Transcript\n\n")
 
         current_speaker: str | None = None
         current_text_parts: list[str] = []
         current_timestamp = ""
+        fmt_time = self._format_time
+        include_timestamps = self._include_timestamps
 
         def format_speaker_header(speaker: str, timestamp: str) -> str:
             """Format speaker header with optional timestamp."""
-            if self._include_timestamps:
+            if include_timestamps:
                 return f"**{speaker}** ({timestamp})"
             return f"**{speaker}**"
 
+        def write_block(header: str, text: str) -> None:
+            """Write a speaker block followed by a blank line."""
+            fp.write(f"{header}\n{text}\n\n")
+
         for segment in result.segments:
             speaker = segment.speaker
-            timestamp = self._format_time(segment.start)
+            timestamp = fmt_time(segment.start)
 
             # Handle overlapping speakers
             if " + " in speaker:
                 # Flush current speaker's text
                 if current_speaker and current_text_parts:
-                    lines.append(format_speaker_header(current_speaker, current_timestamp))
-                    lines.append(" ".join(current_text_parts))
-                    lines.append("")
+                    write_block(
+                        format_speaker_header(current_speaker, current_timestamp),
+                        " ".join(current_text_parts),
+                    )
                     current_text_parts = []
                     current_speaker = None
 
                 # Add overlap as separate block
                 header = format_speaker_header(speaker, timestamp)
-                lines.append(f"{header} *[overlapping]*")
-                lines.append(segment.text)
-                lines.append("")
+                write_block(f"{header} *[overlapping]*", segment.text)
             elif speaker != current_speaker:
                 # Flush previous speaker's text
                 if current_speaker and current_text_parts:
-                    lines.append(format_speaker_header(current_speaker, current_timestamp))
-                    lines.append(" ".join(current_text_parts))
-                    lines.append("")
+                    write_block(
+                        format_speaker_header(current_speaker, current_timestamp),
+                        " ".join(current_text_parts),
+                    )
 
                 # Start new speaker
                 current_speaker = speaker
@@ -206,9 +210,10 @@ class MarkdownFormatter(OutputFormatter):
 
         # Flush final speaker
         if current_speaker and current_text_parts:
-            lines.append(format_speaker_header(current_speaker, current_timestamp))
-            lines.append(" ".join(current_text_parts))
-            lines.append("")
+            write_block(
+                format_speaker_header(current_speaker, current_timestamp),
+                " ".join(current_text_parts),
+            )
 
         # Add metadata footer
         speaker_count = len(result.speakers)
@@ -218,21 +223,14 @@ class MarkdownFormatter(OutputFormatter):
             lang_str = f"Language: {result.language}"
         else:
             lang_str = f"Language: {result.language} ({result.language_probability:.0%} confidence)"
-        lines.extend(
-            [
-                "---",
-                "",
-                f"*{speaker_count} speakers detected • Duration: {duration_str} • {lang_str}*",
-            ]
+        fp.write(
+            f"---\n\n*{speaker_count} speakers detected • Duration: {duration_str} • {lang_str}*"
         )
 
-        return "\n".join(lines)
-
     @staticmethod
     def _format_time(seconds: float) -> str:
         """Format seconds as MM:SS"""
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
+        mins, secs = divmod(int(seconds), 60)
         return f"{mins:02d}:{secs:02d}"
 
     @staticmethod
@@ -249,68 +247,56 @@ class MarkdownFormatter(OutputFormatter):
 class SRTFormatter(OutputFormatter):
     """SRT subtitle formatter."""
 
-    def format(self, result: TranscriptionResult | DiarizationResult) -> str:
-        """Format as SRT subtitles."""
+    def format_to(self, result: TranscriptionResult | DiarizationResult, fp: TextIO) -> None:
+        """Write as SRT subtitles."""
         if self._is_diarization_result(result):
-            return self._format_diarization(result)  # type: ignore[arg-type]
-        return self._format_transcription(result)  # type: ignore[arg-type]
-
-    def _format_transcription(self, result: TranscriptionResult) -> str:
-        """Format transcription result as SRT."""
-        lines: list[str] = []
-
-        for i, segment in enumerate(result.segments, 1):
-            # Sequence number
-            lines.append(str(i))
-
-            # Timestamps
-            start_time = self._format_srt_time(segment.start)
-            end_time = self._format_srt_time(segment.end)
-            lines.append(f"{start_time} --> {end_time}")
-
-            # Text
-            lines.append(segment.text)
-
-            # Blank line between entries
-            lines.append("")
-
-        return "\n".join(lines)
-
-    def _format_diarization(self, result: DiarizationResult) -> str:
-        """Format diarization result as SRT with speaker labels."""
-        lines: list[str] = []
-
-        for i, segment in enumerate(result.segments, 1):
-            # Sequence number
-            lines.append(str(i))
+            self._format_diarization(result, fp)  # type: ignore[arg-type]
+        else:
+            self._format_transcription(result, fp)  # type: ignore[arg-type]
+
+    def _format_transcription(self, result: TranscriptionResult, fp: TextIO) -> None:
+        """Write transcription result as SRT."""
+        # One entry per segment: sequence number, timestamps, text, blank line between
+        fmt_time = self._format_srt_time
+        fp.write(
+            "\n".join(
+                f"{i}\n{fmt_time(s.start)} --> {fmt_time(s.end)}\n{s.text}\n"
+                for i, s in enumerate(result.segments, 1)
+            )
+        )
 
-            # Timestamps
-            start_time = self._format_srt_time(segment.start)
-            end_time = self._format_srt_time(segment.end)
-            lines.append(f"{start_time} --> {end_time}")
+    def _format_diarization(self, result: DiarizationResult, fp: TextIO) -> None:
+        """Write diarization result as SRT with speaker labels."""
+        fmt_time = self._format_srt_time
 
-            # Text with speaker label
+        def format_entry(i: int, segment: DiarizedSegment) -> str:
+            # Text with speaker label; overlapping speakers get their own line
             speaker = segment.speaker
             if " + " in speaker:
-                # Overlapping speakers
-                lines.append(f"[{speaker}] [overlapping]")
-                lines.append(segment.text)
+                text = f"[{speaker}] [overlapping]\n{segment.text}"
             else:
-                lines.append(f"[{speaker}] {segment.text}")
+                text = f"[{speaker}] {segment.text}"
+            return f"{i}\n{fmt_time(segment.start)} --> {fmt_time(segment.end)}\n{text}\n"
 
-            # Blank line between entries
-            lines.append("")
-
-        return "\n".join(lines)
+        fp.write("\n".join(format_entry(i, s) for i, s in enumerate(result.segments, 1)))
 
     @staticmethod
     def _format_srt_time(seconds: float) -> str:
         """Format seconds as HH:MM:SS,mmm (SRT format)."""
-        hours = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
-        secs = seconds % 60
+        secs, ms = divmod(round(seconds * 1000), 1000)
+        mins, secs = divmod(secs, 60)
+        hours, mins = divmod(mins, 60)
         # SRT uses comma for milliseconds
-        return f"{hours:02d}:{mins:02d}:{secs:06.3f}".replace(".", ",")
+        return f"{hours:02d}:{mins:02d}:{secs:02d},{ms:03d}"
+
+
+# Formatter registry keyed by format name (mirrors VALID_OUTPUT_FORMATS)
+_FORMATTERS: dict[str, Callable[[bool], OutputFormatter]] = {
+    "plain": PlainFormatter,
+    "markdown": MarkdownFormatter,
+    # SRT always has timestamps
+    "srt": lambda include_timestamps: SRTFormatter(),
+}
 
 
 def get_formatter(format_name: str, include_timestamps: bool = False) -> OutputFormatter:
@@ -327,13 +313,10 @@ def get_formatter(format_name: str, include_timestamps: bool = False) -> OutputF
     Raises:
         ValueError: If format name is invalid.
     """
-    match format_name:
-        case "plain":
-            return PlainFormatter(include_timestamps=include_timestamps)
-        case "markdown":
-            return MarkdownFormatter(include_timestamps=include_timestamps)
-        case "srt":
-            # SRT always has timestamps
-            return SRTFormatter()
-        case _:
-            raise ValueError(f"Unknown format: {format_name}. Valid formats: plain, markdown, srt")
+    try:
+        factory = _FORMATTERS[format_name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown format: {format_name}. Valid formats: {', '.join(_FORMATTERS)}"
+        ) from None
+    return factory(include_timestamps)
@@ -187,24 +187,26 @@ class KeypressHandler:
             )
         self._active = False
 
-    def _get_key_windows(self, timeout: float) -> str | None:
+    def _get_key_windows(self, timeout: float | None) -> str | None:
         """Windows implementation of get_key with timeout."""
         start = time.time()
         poll_interval = 0.01  # 10ms polling
 
-        while (time.time() - start) < timeout:
+        # Poll even without a timeout: a blocking getwch() would swallow Ctrl+C
+        while timeout is None or (time.time() - start) < timeout:
             if msvcrt.kbhit():  # pyrefly: ignore[missing-attribute]
                 return msvcrt.getwch()  # pyrefly: ignore[missing-attribute]
             time.sleep(poll_interval)
 
         return None
 
-    def get_key(self, timeout: float = 0.1) -> str | None:
+    def get_key(self, timeout: float | None = 0.1) -> str | None:
         """
         Get pressed key with timeout.
 
         Args:
-            timeout: Time to wait for a key in seconds.
+            timeout: Time to wait for a key in seconds, or None to block until
+                a key is pressed.
 
         Returns:
             The pressed key character, or None if no key was pressed.
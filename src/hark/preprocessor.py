@@ -212,7 +212,7 @@ class AudioPreprocessor:
 
     def process(
         self,
-        audio_path: Path,
+        audio_path: Path | np.ndarray,
         sample_rate: int,
         progress_callback: Callable[[str, float], None] | None = None,
         preserve_stereo: bool = False,
@@ -221,7 +221,8 @@ class AudioPreprocessor:
         Process audio through the preprocessing pipeline.
 
         Args:
-            audio_path: Path to the audio file.
+            audio_path: Path to the audio file, or recorded samples of shape
+                (frames, channels) already at sample_rate.
             sample_rate: Expected sample rate.
             progress_callback: Callback for progress updates (step_name, progress).
             preserve_stereo: If True, preserve stereo channels instead of converting to mono.
@@ -233,9 +234,14 @@ class AudioPreprocessor:
         Raises:
             PreprocessingError: If preprocessing fails.
         """
-        # Load audio from file
+        # Load audio from file (in-memory recordings skip the decode)
         try:
-            audio, file_sr = sf.read(audio_path, dtype="float32")
+            if isinstance(audio_path, np.ndarray):
+                audio, file_sr = audio_path, sample_rate
+                if audio.ndim == 2 and audio.shape[1] == 1:
+                    audio = audio[:, 0]
+            else:
+                audio, file_sr = sf.read(audio_path, dtype="float32")
 
             is_stereo = audio.ndim == 2 and audio.shape[1] == 2
 
@@ -9,18 +9,29 @@ This module provides audio recording functionality with support for:
 Components:
 - AudioRecorder: Main recording class with start/stop/duration tracking
 - RecordingFileManager: Manages temporary WAV file creation and writing
+- RecordingBuffer: Holds short recordings in memory instead of a temp file
 - DualStreamInterleaver: Handles buffer interleaving for dual-stream mode
+- RecordingWriter: Writes single-stream audio to file on a background thread
+- SilenceDetector: VAD-driven end-of-speech detection for auto-stop
 - AudioDeviceInfo: Type definition for device information
 """
 
+from hark.recorder.buffer import RecordingBuffer
 from hark.recorder.file_manager import RecordingFileManager
 from hark.recorder.interleaver import DualStreamInterleaver
 from hark.recorder.recorder import AudioRecorder
 from hark.recorder.types import AudioDeviceInfo
+from hark.recorder.vad import SilenceDetector, VoiceActivityDetector, energy_vad
+from hark.recorder.writer import RecordingWriter
 
 __all__ = [
     "AudioDeviceInfo",
     "AudioRecorder",
     "DualStreamInterleaver",
+    "RecordingBuffer",
     "RecordingFileManager",
+    "RecordingWriter",
+    "SilenceDetector",
+    "VoiceActivityDetector",
+    "energy_vad",
 ]
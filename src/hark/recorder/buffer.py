@@ -0,0 +1,63 @@
+"""In-memory recording storage for hark."""
+
+import threading
+
+import numpy as np
+
+__all__ = ["RecordingBuffer"]
+
+
+class RecordingBuffer:
+    """
+    Holds a recording in a preallocated in-memory array.
+
+    Used in place of RecordingFileManager when the whole recording fits in
+    memory, so the audio never round-trips through a temp WAV file.
+
+    Responsibilities:
+    - Preallocating a float32 array for the maximum recording length
+    - Appending audio data (thread-safe)
+    - Tracking frames written
+    - Exposing the recorded audio without copying
+    """
+
+    def __init__(self, capacity: int, channels: int) -> None:
+        """
+        Initialize the buffer.
+
+        Args:
+            capacity: Maximum number of frames to hold.
+            channels: Number of audio channels.
+        """
+        self._buffer = np.empty((capacity, channels), dtype=np.float32)
+        self._frames_written = 0
+        self._lock = threading.Lock()
+
+    @property
+    def frames_written(self) -> int:
+        """Get number of frames written."""
+        return self._frames_written
+
+    @property
+    def audio(self) -> np.ndarray:
+        """Get the recorded audio as a (frames, channels) view."""
+        return self._buffer[: self._frames_written]
+
+    def write(self, data: np.ndarray) -> int:
+        """
+        Append audio data to the buffer (thread-safe).
+
+        Data beyond the buffer capacity is dropped.
+
+        Args:
+            data: Audio data as numpy array of shape (frames, channels).
+
+        Returns:
+            Number of frames written.
+        """
+        with self._lock:
+            start = self._frames_written
+            frames = min(len(data), len(self._buffer) - start)
+            self._buffer[start : start + frames] = data[:frames]
+            self._frames_written += frames
+            return frames
@@ -9,6 +9,7 @@ from pathlib import Path
 import numpy as np
 import soundfile as sf
 
+from hark.constants import DEFAULT_WAV_SUBTYPE
 from hark.exceptions import AudioDeviceBusyError
 
 __all__ = ["RecordingFileManager"]
@@ -19,7 +20,7 @@ class RecordingFileManager:
     Manages temporary audio file creation, writing, and cleanup.
 
     Responsibilities:
-    - Creating temp directory and WAV file
+    - Creating temp directory and WAV file (optionally unnamed, via O_TMPFILE)
     - Opening SoundFile for writing
     - Thread-safe audio data writing
     - Tracking frames written
@@ -31,6 +32,8 @@ class RecordingFileManager:
         temp_dir: Path,
         sample_rate: int,
         channels: int,
+        subtype: str = DEFAULT_WAV_SUBTYPE,
+        anonymous: bool = False,
     ) -> None:
         """
         Initialize the file manager.
@@ -39,11 +42,19 @@ class RecordingFileManager:
             temp_dir: Directory for temporary audio files.
             sample_rate: Audio sample rate in Hz.
             channels: Number of audio channels.
+            subtype: WAV subtype passed to soundfile (e.g. "PCM_16", "FLOAT").
+            anonymous: Prefer an unnamed O_TMPFILE file (Linux) that the kernel
+                frees once its descriptor closes, so a killed process cannot leak
+                it. file_path is then a /proc/self/fd path, readable until
+                cleanup(). Falls back to a named temp file where unsupported.
         """
         self._temp_dir = temp_dir
         self._sample_rate = sample_rate
         self._channels = channels
+        self._subtype = subtype
+        self._anonymous = anonymous
         self._temp_file: Path | None = None
+        self._fd: int | None = None  # Held open for anonymous files
         self._sound_file: sf.SoundFile | None = None
         self._lock = threading.Lock()
         self._frames_written = 0
@@ -77,30 +88,59 @@ class RecordingFileManager:
         self._temp_dir.mkdir(parents=True, exist_ok=True)
 
         # Create temporary file
-        fd, temp_path = tempfile.mkstemp(suffix=".wav", dir=self._temp_dir)
-        self._temp_file = Path(temp_path)
-
-        # Close the file descriptor from mkstemp
-        os.close(fd)
+        target: Path | int
+        self._fd = self._open_anonymous() if self._anonymous else None
+        if self._fd is not None:
+            self._temp_file = Path(f"/proc/self/fd/{self._fd}")
+            target = self._fd
+        else:
+            fd, temp_path = tempfile.mkstemp(suffix=".wav", dir=self._temp_dir)
+            self._temp_file = Path(temp_path)
+
+            # Close the file descriptor from mkstemp
+            os.close(fd)
+            target = self._temp_file
 
         # Open sound file for writing
         try:
             self._sound_file = sf.SoundFile(
-                self._temp_file,
+                target,
                 mode="w",
                 samplerate=self._sample_rate,
                 channels=self._channels,
                 format="WAV",
-                subtype="FLOAT",
+                subtype=self._subtype,
+                closefd=False,  # An anonymous file's data lives only as long as its fd
             )
         except Exception as e:
-            self._temp_file.unlink(missing_ok=True)
-            self._temp_file = None
+            self._release_file()
             raise AudioDeviceBusyError(f"Failed to create audio file: {e}") from e
 
         self._frames_written = 0
         return self._temp_file
 
+    def _open_anonymous(self) -> int | None:
+        """Open an unnamed file in the temp directory, or return None if unsupported."""
+        o_tmpfile = getattr(os, "O_TMPFILE", None)
+        if o_tmpfile is None:
+            return None
+        try:
+            return os.open(self._temp_dir, o_tmpfile | os.O_RDWR, 0o600)
+        except OSError:
+            # Kernel or filesystem without O_TMPFILE support
+            return None
+
+    def _release_file(self) -> None:
+        """Close an anonymous file's descriptor, or delete a named temp file."""
+        if self._fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
+        elif self._temp_file is not None:
+            with contextlib.suppress(Exception):
+                self._temp_file.unlink(missing_ok=True)
+        self._temp_file = None
+
     def write(self, data: np.ndarray) -> int:
         """
         Write audio data to the file (thread-safe).
@@ -132,7 +172,4 @@ class RecordingFileManager:
     def cleanup(self) -> None:
         """Close the file and remove the temporary file."""
         self.close()
-        if self._temp_file is not None:
-            with contextlib.suppress(Exception):
-                self._temp_file.unlink(missing_ok=True)
-            self._temp_file = None
+        self._release_file()
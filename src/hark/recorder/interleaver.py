@@ -2,10 +2,11 @@
 
 import threading
 import time
+from collections.abc import Callable
 
 import numpy as np
 
-from hark.recorder.file_manager import RecordingFileManager
+from hark.recorder.types import AudioSink
 
 __all__ = ["DualStreamInterleaver"]
 
@@ -21,14 +22,22 @@ class DualStreamInterleaver:
     - Flushing remaining buffers on stop
     """
 
-    def __init__(self, file_manager: RecordingFileManager) -> None:
+    def __init__(
+        self,
+        sink: AudioSink,
+        on_block: Callable[[np.ndarray], None] | None = None,
+    ) -> None:
         """
         Initialize the interleaver.
 
         Args:
-            file_manager: RecordingFileManager to write interleaved audio to.
+            sink: Sink to write interleaved audio to (file or in-memory buffer).
+            on_block: Optional hook called on the interleaving thread with each
+                stereo block after it is written (e.g. SilenceDetector.feed).
+                If it raises, the hook is disabled and interleaving continues.
         """
-        self._file_manager = file_manager
+        self._sink = sink
+        self._on_block = on_block
         self._mic_buffer: list[np.ndarray] = []
         self._speaker_buffer: list[np.ndarray] = []
         self._lock = threading.Lock()
@@ -94,7 +103,7 @@ class DualStreamInterleaver:
             time.sleep(0.01)
 
     def _process_buffers(self) -> None:
-        """Process available buffer pairs and write to file."""
+        """Process available buffer pairs and write them to the sink."""
         with self._lock:
             min_chunks = min(len(self._mic_buffer), len(self._speaker_buffer))
 
@@ -115,7 +124,13 @@ class DualStreamInterleaver:
                     ]
                 )
 
-                self._file_manager.write(stereo)
+                self._sink.write(stereo)
+                if self._on_block is not None:
+                    try:
+                        self._on_block(stereo)
+                    except Exception:
+                        # A broken detector must not stop the interleaving
+                        self._on_block = None
 
     def _flush_remaining(self) -> None:
         """Flush any remaining matched buffer pairs."""
@@ -137,7 +152,7 @@ class DualStreamInterleaver:
                     ]
                 )
 
-                self._file_manager.write(stereo)
+                self._sink.write(stereo)
 
             # Clear any remaining unmatched buffers
             self._mic_buffer.clear()
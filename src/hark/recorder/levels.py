@@ -0,0 +1,25 @@
+"""Audio level measurement for hark."""
+
+import math
+
+import numpy as np
+
+__all__ = ["rms"]
+
+
+def rms(data: np.ndarray) -> float:
+    """Compute the RMS level of an audio block in a single pass.
+
+    Uses a BLAS dot product instead of ``sqrt(mean(x**2))`` to avoid
+    allocating a squared temporary on the audio thread.
+
+    Args:
+        data: Audio samples of any shape.
+
+    Returns:
+        RMS level, or 0.0 for an empty block.
+    """
+    flat = data.reshape(-1)
+    if flat.size == 0:
+        return 0.0
+    return math.sqrt(float(np.dot(flat, flat)) / flat.size)
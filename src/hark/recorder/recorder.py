@@ -22,12 +22,18 @@ from hark.constants import (
     DEFAULT_INPUT_SOURCE,
     DEFAULT_SAMPLE_RATE,
     DEFAULT_TEMP_DIR,
+    DEFAULT_WAV_SUBTYPE,
+    MAX_IN_MEMORY_RECORDING_BYTES,
 )
 from hark.exceptions import AudioDeviceBusyError, NoLoopbackDeviceError, NoMicrophoneError
 from hark.platform import is_windows
+from hark.recorder.buffer import RecordingBuffer
 from hark.recorder.file_manager import RecordingFileManager
 from hark.recorder.interleaver import DualStreamInterleaver
-from hark.recorder.types import AudioDeviceInfo
+from hark.recorder.levels import rms
+from hark.recorder.types import AudioDeviceInfo, AudioSink
+from hark.recorder.vad import SilenceDetector, VoiceActivityDetector
+from hark.recorder.writer import RecordingWriter
 from hark.utils import env_vars
 
 # WASAPI stream availability check (Windows only)
@@ -78,14 +84,18 @@ class AudioRecorder:
     Records audio from microphone and/or system audio with real-time level monitoring.
 
     Streams audio to a temporary WAV file to handle long recordings
-    without running out of memory. Supports three input modes:
+    without running out of memory, or optionally into an in-memory buffer
+    when the maximum duration fits. Supports three input modes:
     - mic: Microphone only (default)
     - speaker: System audio/loopback only
     - both: Simultaneous mic + speaker capture to stereo (L=mic, R=speaker)
 
     This class uses composition with focused components:
     - RecordingFileManager: Handles temp file creation, writing, and cleanup
+    - RecordingBuffer: Holds the recording in memory (in_memory mode)
     - DualStreamInterleaver: Handles buffer management for dual-stream mode
+    - RecordingWriter: Drains single-stream audio to the file off the audio thread
+    - SilenceDetector: Ends the recording after speech then silence (vad mode)
     """
 
     def __init__(
@@ -97,6 +107,10 @@ class AudioRecorder:
         temp_dir: Path = DEFAULT_TEMP_DIR,
         buffer_size: int = DEFAULT_BUFFER_SIZE,
         input_source: str = DEFAULT_INPUT_SOURCE,
+        subtype: str = DEFAULT_WAV_SUBTYPE,
+        in_memory: bool = False,
+        vad: VoiceActivityDetector | None = None,
+        anonymous_file: bool = False,
     ) -> None:
         """
         Initialize the audio recorder.
@@ -109,6 +123,17 @@ class AudioRecorder:
             temp_dir: Directory for temporary audio files.
             buffer_size: Audio buffer size for sounddevice.
             input_source: Input source mode ("mic", "speaker", or "both").
+            subtype: WAV subtype for the recording file. The stream stays float32;
+                libsndfile converts on write.
+            in_memory: If True, keep the recording in a preallocated array and
+                return it from stop() instead of a temp file path. Falls back
+                to a temp file when max_duration would exceed
+                MAX_IN_MEMORY_RECORDING_BYTES.
+            vad: Optional voice activity detector. When set, recording stops
+                automatically once speech is followed by sustained silence.
+                It runs on the writer thread, never the audio callback.
+            anonymous_file: Prefer an unnamed O_TMPFILE recording file that
+                cannot outlive the process (see RecordingFileManager).
         """
         self._sample_rate = sample_rate
         self._channels = channels
@@ -117,17 +142,25 @@ class AudioRecorder:
         self._temp_dir = temp_dir
         self._buffer_size = buffer_size
         self._input_source = InputSource(input_source)
+        self._subtype = subtype
+        self._in_memory = in_memory
+        self._vad = vad
+        self._anonymous_file = anonymous_file
 
         # Recording state
         self._is_recording = False
         self._start_time: float | None = None
+        # Set when recording ends, so callers can block instead of polling
+        self._stopped = threading.Event()
 
         # Components (created on start)
         self._file_manager: RecordingFileManager | None = None
+        self._memory_buffer: RecordingBuffer | None = None
         self._interleaver: DualStreamInterleaver | None = None
+        self._writer: RecordingWriter | None = None
 
         # Stream management
-        self._stream: sd.InputStream | None = None
+        self._stream: sd.RawInputStream | None = None
         self._mic_stream: sd.InputStream | None = None
         self._speaker_stream: sd.InputStream | None = None
 
@@ -144,6 +177,20 @@ class AudioRecorder:
         """Check if recording is in progress."""
         return self._is_recording
 
+    @property
+    def _sink(self) -> AudioSink | None:
+        """Get whichever sink the recording is written to."""
+        return self._memory_buffer if self._memory_buffer is not None else self._file_manager
+
+    def _fits_in_memory(self) -> bool:
+        """Check whether a max-duration recording fits the in-memory limit."""
+        size = self._memory_capacity() * self._channels * np.dtype(np.float32).itemsize
+        return size <= MAX_IN_MEMORY_RECORDING_BYTES
+
+    def _memory_capacity(self) -> int:
+        """Frames to preallocate: max duration plus one second of callback slack."""
+        return (self._max_duration + 1) * self._sample_rate
+
     # Backwards-compatible properties for internal state access
     @property
     def _temp_file(self) -> Path | None:
@@ -170,7 +217,8 @@ class AudioRecorder:
     @property
     def _frames_written(self) -> int:
         """Get frames written (backwards compatibility)."""
-        return self._file_manager.frames_written if self._file_manager else 0
+        sink = self._sink
+        return sink.frames_written if sink is not None else 0
 
     @_frames_written.setter
     def _frames_written(self, value: int) -> None:
@@ -246,17 +294,40 @@ class AudioRecorder:
         # Get devices for the configured source
         self._mic_device, self._speaker_device = get_devices_for_source(self._input_source)
 
-        # Create file manager and initialize recording file
-        self._file_manager = RecordingFileManager(
-            temp_dir=self._temp_dir,
-            sample_rate=self._sample_rate,
-            channels=self._channels,
-        )
-        self._file_manager.create()
+        # Create the sink: an in-memory buffer, or a temp recording file
+        sink: AudioSink
+        if self._in_memory and self._fits_in_memory():
+            self._memory_buffer = RecordingBuffer(self._memory_capacity(), self._channels)
+            sink = self._memory_buffer
+        else:
+            self._file_manager = RecordingFileManager(
+                temp_dir=self._temp_dir,
+                sample_rate=self._sample_rate,
+                channels=self._channels,
+                subtype=self._subtype,
+                anonymous=self._anonymous_file,
+            )
+            self._file_manager.create()
+            sink = self._file_manager
+
+        # Detect end of speech on the draining thread
+        on_block = None
+        if self._vad is not None:
+            detector = SilenceDetector(self._vad, self._sample_rate, on_silence=self._mark_stopped)
+            on_block = detector.feed
 
         # Create interleaver for dual-stream mode
         if self._input_source == InputSource.BOTH:
-            self._interleaver = DualStreamInterleaver(self._file_manager)
+            self._interleaver = DualStreamInterleaver(sink, on_block=on_block)
+        else:
+            # Single-stream callbacks hand blocks to a writer thread
+            self._writer = RecordingWriter(
+                sink,
+                block_size=self._buffer_size,
+                channels=self._channels,
+                on_block=on_block,
+            )
+            self._writer.start()
 
         # Start appropriate stream(s) based on input source
         try:
@@ -275,6 +346,7 @@ class AudioRecorder:
             self._cleanup()
             raise AudioDeviceBusyError(f"Failed to start audio stream: {e}") from e
 
+        self._stopped.clear()
         self._is_recording = True
         self._start_time = time.time()
 
@@ -309,13 +381,15 @@ class AudioRecorder:
         # Use env_vars context manager to temporarily set env vars during stream creation
         # This ensures PULSE_SOURCE etc. are only set when needed and cleaned up after
         with env_vars(recording_env):
-            self._stream = sd.InputStream(
+            # Raw stream: the callback views PortAudio's buffer instead of
+            # sounddevice allocating an ndarray per block
+            self._stream = sd.RawInputStream(
                 device=device,
-                callback=self._audio_callback,
+                callback=self._raw_callback,
                 channels=self._channels,
                 samplerate=self._sample_rate,
                 blocksize=self._buffer_size,
-                dtype=np.float32,
+                dtype="float32",
                 latency="low",
             )
             self._stream.start()
@@ -390,13 +464,12 @@ class AudioRecorder:
 
         # Check max duration
         if self._start_time and (time.time() - self._start_time) >= self._max_duration:
-            self._is_recording = False
+            self._mark_stopped()
             return
 
         # Calculate RMS level for UI feedback (use mic for level in both mode)
         if self._level_callback:
-            rms = float(np.sqrt(np.mean(indata**2)))
-            self._level_callback(rms)
+            self._level_callback(rms(indata))
 
         # Add to interleaver buffer
         if self._interleaver:
@@ -471,7 +544,7 @@ class AudioRecorder:
 
         # Check max duration
         if self._start_time and (time.time() - self._start_time) >= self._max_duration:
-            self._is_recording = False
+            self._mark_stopped()
             return (None, pyaudio.paComplete)
 
         if in_data is None:
@@ -483,12 +556,11 @@ class AudioRecorder:
 
         # Calculate RMS level for UI feedback
         if self._level_callback:
-            rms = float(np.sqrt(np.mean(audio_data**2)))
-            self._level_callback(rms)
+            self._level_callback(rms(audio_data))
 
-        # Write to file via file manager
-        if self._file_manager:
-            self._file_manager.write(audio_data)
+        # Queue for the writer thread
+        if self._writer:
+            self._writer.push(audio_data)
 
         return (None, pyaudio.paContinue)
 
@@ -566,19 +638,21 @@ class AudioRecorder:
         if self._interleaver:
             self._interleaver._interleave_loop()
 
-    def stop(self) -> Path:
+    def stop(self) -> Path | np.ndarray:
         """
-        Stop recording and return the path to the recorded audio file.
+        Stop recording and return the recorded audio.
 
         Returns:
-            Path to the temporary WAV file containing the recording.
+            Path to the temporary WAV file containing the recording, or the
+            recorded samples as a (frames, channels) float32 array when
+            recording in memory.
         """
-        if not self._is_recording:
-            if self._file_manager and self._file_manager.file_path:
-                return self._file_manager.file_path
+        if self._sink is None:
             raise RuntimeError("Recording was never started")
 
-        self._is_recording = False
+        # Teardown below is idempotent, so this also finalizes a recording
+        # that already ended from a callback (max duration reached)
+        self._mark_stopped()
 
         # Stop interleaver thread if running
         if self._interleaver is not None:
@@ -624,9 +698,20 @@ class AudioRecorder:
                 self._pyaudio_instance.terminate()
             self._pyaudio_instance = None
 
-        # Close file manager
-        if self._file_manager is not None:
-            self._file_manager.close()
+        # Drain pending blocks now that no callback can run; a sink write
+        # failure surfaces here rather than as a truncated recording
+        try:
+            if self._writer is not None:
+                writer, self._writer = self._writer, None
+                writer.stop()
+        finally:
+            # Close file manager even if draining failed, so release() can
+            # remove the file
+            if self._file_manager is not None:
+                self._file_manager.close()
+
+        if self._memory_buffer is not None:
+            return self._memory_buffer.audio
 
         if self._file_manager is None or self._file_manager.file_path is None:
             raise RuntimeError("No temp file created")
@@ -642,6 +727,26 @@ class AudioRecorder:
         if self._interleaver:
             self._interleaver._flush_remaining()
 
+    def _mark_stopped(self) -> None:
+        """Mark recording as finished and wake any wait_until_stopped() callers."""
+        self._is_recording = False
+        self._stopped.set()
+
+    def wait_until_stopped(self, timeout: float | None = None) -> bool:
+        """
+        Block until recording stops or the timeout elapses.
+
+        Recording stops when stop() is called, the maximum duration is reached,
+        or the VAD detects the end of speech.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            True if recording has stopped, False if the timeout elapsed first.
+        """
+        return self._stopped.wait(timeout)
+
     def get_duration(self) -> float:
         """
         Get the current recording duration in seconds.
@@ -654,8 +759,27 @@ class AudioRecorder:
         if self._is_recording:
             return time.time() - self._start_time
         # If stopped, calculate from frames written
-        frames = self._file_manager.frames_written if self._file_manager else 0
-        return frames / self._sample_rate
+        return self._frames_written / self._sample_rate
+
+    def _raw_callback(
+        self,
+        indata: Any,
+        frames: int,
+        time_info: dict,
+        status: sd.CallbackFlags,
+    ) -> None:
+        """
+        Callback for sounddevice RawInputStream.
+
+        Args:
+            indata: Raw float32 input buffer owned by PortAudio.
+            frames: Number of frames.
+            time_info: Time information.
+            status: Status flags.
+        """
+        # Zero-copy view; the writer copies it before the callback returns
+        audio = np.frombuffer(indata, dtype=np.float32).reshape(frames, self._channels)
+        self._audio_callback(audio, frames, time_info, status)
 
     def _audio_callback(
         self,
@@ -665,7 +789,7 @@ class AudioRecorder:
         status: sd.CallbackFlags,
     ) -> None:
         """
-        Callback for sounddevice InputStream.
+        Process a block of input audio (called via _raw_callback).
 
         Args:
             indata: Input audio data.
@@ -682,17 +806,16 @@ class AudioRecorder:
 
         # Check max duration
         if self._start_time and (time.time() - self._start_time) >= self._max_duration:
-            self._is_recording = False
+            self._mark_stopped()
             return
 
         # Calculate RMS level for UI feedback
         if self._level_callback:
-            rms = float(np.sqrt(np.mean(indata**2)))
-            self._level_callback(rms)
+            self._level_callback(rms(indata))
 
-        # Write to file via file manager
-        if self._file_manager:
-            self._file_manager.write(indata)
+        # Queue for the writer thread (no file I/O on the audio thread)
+        if self._writer:
+            self._writer.push(indata)
 
     def _cleanup(self) -> None:
         """Clean up resources."""
@@ -741,10 +864,26 @@ class AudioRecorder:
                 self._pyaudio_instance.terminate()
             self._pyaudio_instance = None
 
-        # Clean up file manager
+        # Stop writer
+        if self._writer is not None:
+            with contextlib.suppress(Exception):
+                self._writer.stop()
+            self._writer = None
+
+        self.release()
+
+    def release(self) -> None:
+        """
+        Release the recorded audio returned by stop().
+
+        Closes an anonymous temp file's descriptor (which frees the file) or
+        deletes a named temp file, and drops in-memory samples. Call once the
+        recording is no longer needed; safe to call more than once.
+        """
         if self._file_manager is not None:
             self._file_manager.cleanup()
             self._file_manager = None
+        self._memory_buffer = None
 
     @staticmethod
     def list_devices() -> list[AudioDeviceInfo]:
@@ -1,8 +1,10 @@
 """Type definitions for the recorder module."""
 
-from typing import TypedDict
+from typing import Protocol, TypedDict
 
-__all__ = ["AudioDeviceInfo"]
+import numpy as np
+
+__all__ = ["AudioDeviceInfo", "AudioSink"]
 
 
 class AudioDeviceInfo(TypedDict):
@@ -12,3 +14,16 @@ class AudioDeviceInfo(TypedDict):
     name: str
     channels: int
     sample_rate: float
+
+
+class AudioSink(Protocol):
+    """Destination for recorded audio (RecordingFileManager or RecordingBuffer)."""
+
+    @property
+    def frames_written(self) -> int:
+        """Get number of frames written."""
+        ...
+
+    def write(self, data: np.ndarray) -> int:
+        """Write audio data and return the number of frames written."""
+        ...
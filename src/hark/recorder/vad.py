@@ -0,0 +1,123 @@
+"""Voice-activity based auto-stop for hark."""
+
+from collections.abc import Callable
+
+import numpy as np
+
+from hark.constants import DEFAULT_SILENCE_THRESHOLD_DB
+from hark.recorder.levels import rms
+
+__all__ = ["SilenceDetector", "VoiceActivityDetector", "energy_vad"]
+
+# A VAD takes one mono float32 frame and returns True if it contains speech
+VoiceActivityDetector = Callable[[np.ndarray], bool]
+
+# 32ms at 16kHz; also the frame size Silero VAD expects at that rate
+DEFAULT_FRAME_SIZE = 512
+DEFAULT_MIN_SPEECH_MS = 1500
+DEFAULT_TRAILING_SILENCE_MS = 1500
+
+
+def energy_vad(threshold_db: float = DEFAULT_SILENCE_THRESHOLD_DB) -> VoiceActivityDetector:
+    """
+    Create a dependency-free VAD that treats frames above an RMS level as speech.
+
+    Args:
+        threshold_db: Level in dBFS above which a frame counts as speech.
+
+    Returns:
+        VAD callable for SilenceDetector / AudioRecorder.
+    """
+    threshold = 10 ** (threshold_db / 20)
+
+    def is_speech(frame: np.ndarray) -> bool:
+        return rms(frame) > threshold
+
+    return is_speech
+
+
+class SilenceDetector:
+    """
+    Detects the end of an utterance from recorded audio blocks.
+
+    Runs on the writer/interleaver thread rather than the audio callback,
+    so the VAD can be as heavy as a model inference call.
+
+    Responsibilities:
+    - Regrouping incoming blocks into fixed-size mono frames
+    - Classifying each frame with the VAD
+    - Firing on_silence once, after enough speech followed by trailing silence
+    """
+
+    def __init__(
+        self,
+        vad: VoiceActivityDetector,
+        sample_rate: int,
+        on_silence: Callable[[], None],
+        frame_size: int = DEFAULT_FRAME_SIZE,
+        min_speech_ms: int = DEFAULT_MIN_SPEECH_MS,
+        trailing_silence_ms: int = DEFAULT_TRAILING_SILENCE_MS,
+    ) -> None:
+        """
+        Initialize the detector.
+
+        Args:
+            vad: Callable classifying a mono float32 frame as speech (True) or not.
+            sample_rate: Audio sample rate in Hz.
+            on_silence: Called once when speech has been followed by silence.
+            frame_size: Samples per VAD frame.
+            min_speech_ms: Speech required before silence can end the recording.
+            trailing_silence_ms: Consecutive silence that ends the recording.
+        """
+        self._vad = vad
+        self._on_silence = on_silence
+        self._frame_size = frame_size
+        self._frame_ms = frame_size * 1000 / sample_rate
+        self._min_speech_ms = min_speech_ms
+        self._trailing_silence_ms = trailing_silence_ms
+        self._frame = np.empty(frame_size, dtype=np.float32)
+        self._filled = 0
+        self._speech_ms = 0.0
+        self._silent_ms = 0.0
+        self._triggered = False
+
+    @property
+    def triggered(self) -> bool:
+        """Check if end of speech has been detected."""
+        return self._triggered
+
+    def feed(self, data: np.ndarray) -> None:
+        """
+        Feed recorded audio to the detector.
+
+        Args:
+            data: Audio data as numpy array of shape (frames, channels).
+        """
+        if self._triggered:
+            return
+
+        mono = data[:, 0] if data.shape[1] == 1 else data.mean(axis=1)
+        offset = 0
+        while offset < len(mono):
+            take = min(self._frame_size - self._filled, len(mono) - offset)
+            self._frame[self._filled : self._filled + take] = mono[offset : offset + take]
+            self._filled += take
+            offset += take
+
+            if self._filled == self._frame_size:
+                self._filled = 0
+                self._classify_frame()
+                if self._triggered:
+                    return
+
+    def _classify_frame(self) -> None:
+        """Run the VAD on the current frame and update speech/silence totals."""
+        if self._vad(self._frame):
+            self._speech_ms += self._frame_ms
+            self._silent_ms = 0.0
+            return
+
+        self._silent_ms += self._frame_ms
+        if self._speech_ms >= self._min_speech_ms and self._silent_ms >= self._trailing_silence_ms:
+            self._triggered = True
+            self._on_silence()
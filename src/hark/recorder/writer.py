@@ -0,0 +1,150 @@
+"""Background audio writing for hark."""
+
+import queue
+import threading
+from collections.abc import Callable
+
+import numpy as np
+
+from hark.recorder.types import AudioSink
+
+__all__ = ["RecordingWriter"]
+
+# Number of preallocated blocks (8 x 4096 frames is ~2s of headroom at 16kHz)
+DEFAULT_POOL_SIZE = 8
+
+
+class RecordingWriter:
+    """
+    Moves sink writes off the real-time audio callback.
+
+    The audio callback copies each block into a preallocated buffer and hands
+    it to a single writer thread, so no file I/O or lock acquisition happens
+    on the audio thread. Buffers are recycled through a free-list.
+
+    Responsibilities:
+    - Preallocating a pool of float32 block buffers
+    - Copying incoming audio into pooled buffers (producer side)
+    - Running the writer thread that drains blocks into the sink
+    - Draining pending blocks on stop
+    - Isolating the thread from sink and on_block failures
+    """
+
+    def __init__(
+        self,
+        sink: AudioSink,
+        block_size: int,
+        channels: int,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        on_block: Callable[[np.ndarray], None] | None = None,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            sink: Sink to write audio to (file or in-memory buffer).
+            block_size: Frames per pooled buffer (the stream blocksize).
+            channels: Number of audio channels.
+            pool_size: Number of buffers to preallocate.
+            on_block: Optional hook called on the writer thread with each
+                block after it is written (e.g. SilenceDetector.feed). If it
+                raises, the hook is disabled and writing continues.
+        """
+        self._sink = sink
+        self._block_size = block_size
+        self._channels = channels
+        self._on_block = on_block
+        self._free: queue.SimpleQueue[np.ndarray] = queue.SimpleQueue()
+        self._queue: queue.SimpleQueue[tuple[np.ndarray, int] | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._write_error: Exception | None = None
+        self._on_block_error: Exception | None = None
+
+        for _ in range(pool_size):
+            self._free.put(self._new_buffer())
+
+    @property
+    def on_block_error(self) -> Exception | None:
+        """Exception that disabled the on_block hook, if any."""
+        return self._on_block_error
+
+    def _new_buffer(self) -> np.ndarray:
+        """Allocate an empty block buffer."""
+        return np.empty((self._block_size, self._channels), dtype=np.float32)
+
+    def push(self, data: np.ndarray) -> None:
+        """
+        Queue audio data for writing (safe to call from the audio callback).
+
+        Args:
+            data: Audio data as numpy array of shape (frames, channels).
+        """
+        for offset in range(0, len(data), self._block_size):
+            chunk = data[offset : offset + self._block_size]
+            try:
+                buf = self._free.get_nowait()
+            except queue.Empty:
+                # Writer is falling behind; grow the pool rather than drop audio
+                buf = self._new_buffer()
+            frames = len(chunk)
+            np.copyto(buf[:frames], chunk)
+            self._queue.put((buf, frames))
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread = threading.Thread(
+            target=self._writer_loop,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the writer thread after all queued blocks are written.
+
+        Raises:
+            Exception: The first error raised by the sink, re-raised here once
+                the queue is drained so the recording is not silently truncated.
+        """
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        else:
+            # Never started: drain synchronously
+            self._writer_loop()
+
+        if self._write_error is not None:
+            raise self._write_error
+
+    def _writer_loop(self) -> None:
+        """Thread loop that drains queued blocks into the sink."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            buf, frames = item
+            try:
+                self._write_block(buf[:frames])
+            finally:
+                self._free.put(buf)
+
+    def _write_block(self, block: np.ndarray) -> None:
+        """Write one block to the sink, then pass it to the on_block hook."""
+        # After a sink failure keep draining so buffers are recycled, but
+        # stop writing so the output does not skip audio in the middle
+        if self._write_error is not None:
+            return
+        try:
+            self._sink.write(block)
+        except Exception as e:
+            self._write_error = e
+            return
+
+        if self._on_block is not None:
+            try:
+                self._on_block(block)
+            except Exception as e:
+                # A broken detector must not take the recording down with it
+                self._on_block_error = e
+                self._on_block = None
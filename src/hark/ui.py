@@ -1,15 +1,16 @@
 """Terminal UI for hark."""
 
 import sys
+from collections.abc import Iterable
 from enum import Enum
 from typing import TYPE_CHECKING
 
 from hark.constants import UNKNOWN_LANGUAGE_PROBABILITY
-from hark.diarizer import DiarizationResult
-from hark.transcriber import TranscriptionResult
 
 if TYPE_CHECKING:
     from hark.config import HarkConfig
+    from hark.diarizer import DiarizationResult
+    from hark.transcriber import TranscriptionResult
 
 __all__ = [
     "Color",
@@ -101,6 +102,8 @@ class UI:
         print(f"  - Model: {config.whisper.model}")
         print(f"  - Output: {output_file or 'stdout'}")
         print(f"  - Max Duration: {self._format_duration(config.recording.max_duration)}")
+        if config.recording.auto_stop:
+            print("  - Auto-stop: on silence")
 
         preprocessing = []
         if config.preprocessing.noise_reduction.enabled:
@@ -205,6 +208,15 @@ class UI:
         icon = self._color("\u2713", Color.GREEN) if success else self._color("\u2717", Color.RED)
         print(f"  {icon} {step}")
 
+    def preprocessing_steps(self, steps: Iterable[str]) -> None:
+        """Print several successful preprocessing steps in one write."""
+        if self._quiet:
+            return
+        icon = self._color("\u2713", Color.GREEN)
+        lines = [f"  {icon} {step}" for step in steps]
+        if lines:
+            print("\n".join(lines))
+
     def transcription_progress(self, progress: float) -> None:
         """
         Update transcription progress bar.
@@ -225,13 +237,17 @@ class UI:
 
     def transcription_complete(
         self,
-        result: TranscriptionResult | DiarizationResult,
+        result: "TranscriptionResult | DiarizationResult",
         output_path: str | None,
     ) -> None:
         """Print transcription complete summary."""
         if self._quiet:
             return
 
+        # Imported lazily to keep numpy out of CLI startup
+        from hark.diarizer import DiarizationResult
+        from hark.transcriber import TranscriptionResult
+
         # New line after progress bar
         print()
         print()
@@ -272,6 +288,13 @@ class UI:
         error_label = self._color("Error:", Color.RED)
         print(f"{error_label} {message}", file=sys.stderr)
 
+    def errors(self, messages: Iterable[str]) -> None:
+        """Print several error messages in one write."""
+        error_label = self._color("Error:", Color.RED)
+        lines = [f"{error_label} {message}" for message in messages]
+        if lines:
+            print("\n".join(lines), file=sys.stderr)
+
     def warning(self, message: str) -> None:
         """Print warning message."""
         if self._quiet:
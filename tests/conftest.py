@@ -326,6 +326,7 @@ def mock_sounddevice() -> MagicMock:
     mock_stream.stop = MagicMock()
     mock_stream.close = MagicMock()
     mock.InputStream.return_value = mock_stream
+    mock.RawInputStream.return_value = mock_stream
 
     # Mock default device
     mock.default.device = (0, 0)
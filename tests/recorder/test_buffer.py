@@ -0,0 +1,64 @@
+"""Tests for RecordingBuffer component."""
+
+import threading
+
+import numpy as np
+
+from hark.recorder import RecordingBuffer
+
+
+class TestRecordingBuffer:
+    """Tests for RecordingBuffer."""
+
+    def test_initial_state(self) -> None:
+        """Should start empty."""
+        buffer = RecordingBuffer(capacity=100, channels=2)
+        assert buffer.frames_written == 0
+        assert buffer.audio.shape == (0, 2)
+
+    def test_write_appends(self) -> None:
+        """Should append writes in order and track frames."""
+        buffer = RecordingBuffer(capacity=100, channels=1)
+
+        assert buffer.write(np.full((10, 1), 0.5, dtype=np.float32)) == 10
+        assert buffer.write(np.full((5, 1), -0.5, dtype=np.float32)) == 5
+
+        assert buffer.frames_written == 15
+        np.testing.assert_array_equal(buffer.audio[:10], 0.5)
+        np.testing.assert_array_equal(buffer.audio[10:], -0.5)
+
+    def test_write_copies_data(self) -> None:
+        """Should copy data so the caller's buffer can be reused."""
+        buffer = RecordingBuffer(capacity=10, channels=1)
+        data = np.ones((4, 1), dtype=np.float32)
+
+        buffer.write(data)
+        data[:] = 0.0
+
+        np.testing.assert_array_equal(buffer.audio, 1.0)
+
+    def test_write_clamps_to_capacity(self) -> None:
+        """Should drop frames beyond capacity."""
+        buffer = RecordingBuffer(capacity=8, channels=1)
+
+        assert buffer.write(np.ones((6, 1), dtype=np.float32)) == 6
+        assert buffer.write(np.ones((6, 1), dtype=np.float32)) == 2
+        assert buffer.write(np.ones((6, 1), dtype=np.float32)) == 0
+
+        assert buffer.frames_written == 8
+
+    def test_thread_safe_writes(self) -> None:
+        """Should handle concurrent writes safely."""
+        buffer = RecordingBuffer(capacity=1000, channels=1)
+
+        def write_data() -> None:
+            for _ in range(10):
+                buffer.write(np.zeros((10, 1), dtype=np.float32))
+
+        threads = [threading.Thread(target=write_data) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert buffer.frames_written == 500
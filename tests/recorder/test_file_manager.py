@@ -1,5 +1,6 @@
 """Tests for RecordingFileManager component."""
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -65,7 +66,16 @@ class TestRecordingFileManagerCreate:
             assert call_kwargs["samplerate"] == 48000
             assert call_kwargs["channels"] == 2
             assert call_kwargs["format"] == "WAV"
-            assert call_kwargs["subtype"] == "FLOAT"
+            assert call_kwargs["subtype"] == "PCM_16"
+
+    def test_custom_subtype(self, tmp_path: Path) -> None:
+        """Should pass a custom subtype through to SoundFile."""
+        manager = RecordingFileManager(tmp_path, 16000, 1, subtype="FLOAT")
+
+        with patch("soundfile.SoundFile") as mock_sf:
+            manager.create()
+
+            assert mock_sf.call_args[1]["subtype"] == "FLOAT"
 
     def test_raises_on_soundfile_error(self, tmp_path: Path) -> None:
         """Should raise AudioDeviceBusyError on file creation error."""
@@ -228,6 +238,75 @@ class TestRecordingFileManagerCleanup:
         assert manager._temp_file is None
 
 
+@pytest.mark.skipif(not hasattr(os, "O_TMPFILE"), reason="O_TMPFILE is Linux-only")
+class TestRecordingFileManagerAnonymous:
+    """Tests for anonymous (O_TMPFILE) recording files."""
+
+    def test_creates_no_directory_entry(self, tmp_path: Path) -> None:
+        """Should not leave a named file in the temp directory."""
+        manager = RecordingFileManager(tmp_path, 16000, 1, anonymous=True)
+
+        path = manager.create()
+
+        assert path == Path(f"/proc/self/fd/{manager._fd}")
+        assert list(tmp_path.iterdir()) == []
+        manager.cleanup()
+
+    def test_readable_after_close(self, tmp_path: Path) -> None:
+        """Recorded audio should stay readable through file_path until cleanup."""
+        manager = RecordingFileManager(tmp_path, 16000, 1, anonymous=True)
+        path = manager.create()
+
+        manager.write(np.full((1000, 1), 0.5, dtype=np.float32))
+        manager.close()
+
+        audio, sample_rate = sf.read(path, dtype="float32")
+        assert sample_rate == 16000
+        assert len(audio) == 1000
+        manager.cleanup()
+
+    def test_cleanup_closes_descriptor(self, tmp_path: Path) -> None:
+        """cleanup should close the descriptor that keeps the file alive."""
+        manager = RecordingFileManager(tmp_path, 16000, 1, anonymous=True)
+        manager.create()
+        fd = manager._fd
+        assert fd is not None
+
+        manager.cleanup()
+
+        assert manager._fd is None
+        assert manager.file_path is None
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+    def test_falls_back_without_o_tmpfile(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should use a named temp file when O_TMPFILE is unavailable."""
+        monkeypatch.delattr(os, "O_TMPFILE")
+        manager = RecordingFileManager(tmp_path, 16000, 1, anonymous=True)
+
+        with patch("soundfile.SoundFile"):
+            path = manager.create()
+
+        assert manager._fd is None
+        assert path.parent == tmp_path
+        assert path.suffix == ".wav"
+
+    def test_closes_descriptor_on_soundfile_error(self, tmp_path: Path) -> None:
+        """Should release the descriptor if SoundFile cannot be opened."""
+        manager = RecordingFileManager(tmp_path, 16000, 1, anonymous=True)
+
+        with (
+            patch("soundfile.SoundFile", side_effect=Exception("File error")),
+            pytest.raises(AudioDeviceBusyError),
+        ):
+            manager.create()
+
+        assert manager._fd is None
+        assert manager.file_path is None
+
+
 class TestRecordingFileManagerProperties:
     """Tests for RecordingFileManager properties."""
 
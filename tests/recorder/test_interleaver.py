@@ -11,11 +11,11 @@ from hark.recorder import DualStreamInterleaver, RecordingFileManager
 class TestDualStreamInterleaverInit:
     """Tests for DualStreamInterleaver initialization."""
 
-    def test_stores_file_manager(self, tmp_path: Path) -> None:
-        """Should store file manager reference."""
+    def test_stores_sink(self, tmp_path: Path) -> None:
+        """Should store sink reference."""
         file_manager = RecordingFileManager(tmp_path, 16000, 2)
         interleaver = DualStreamInterleaver(file_manager)
-        assert interleaver._file_manager is file_manager
+        assert interleaver._sink is file_manager
 
     def test_initial_state(self, tmp_path: Path) -> None:
         """Should initialize with empty buffers."""
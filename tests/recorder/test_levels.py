@@ -0,0 +1,19 @@
+"""Tests for audio level helpers."""
+
+import numpy as np
+
+from hark.recorder.levels import rms
+
+
+class TestRms:
+    """Tests for rms helper."""
+
+    def test_matches_reference(self) -> None:
+        """Should match sqrt(mean(x**2))."""
+        data = np.random.default_rng(0).standard_normal((2048, 2)).astype(np.float32)
+        expected = float(np.sqrt(np.mean(data**2)))
+        assert abs(rms(data) - expected) < 1e-5
+
+    def test_empty_block_returns_zero(self) -> None:
+        """Should return 0.0 for an empty block."""
+        assert rms(np.zeros((0, 1), dtype=np.float32)) == 0.0
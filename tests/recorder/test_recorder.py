@@ -1,5 +1,6 @@
 """Tests for hark.recorder module."""
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -10,7 +11,7 @@ import sounddevice as sd
 from hark.audio_backends import RecordingConfig
 from hark.audio_sources import AudioSourceInfo, InputSource
 from hark.exceptions import AudioDeviceBusyError, NoLoopbackDeviceError, NoMicrophoneError
-from hark.recorder import AudioRecorder
+from hark.recorder import AudioRecorder, energy_vad
 
 
 class TestAudioRecorderInit:
@@ -76,7 +77,7 @@ class TestAudioRecorderStart:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
         ):
             mock_stream = MagicMock()
@@ -93,7 +94,7 @@ class TestAudioRecorderStart:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
         ):
             mock_stream = MagicMock()
@@ -111,7 +112,7 @@ class TestAudioRecorderStart:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile") as mock_sf,
         ):
             mock_stream = MagicMock()
@@ -122,17 +123,18 @@ class TestAudioRecorderStart:
             assert call_kwargs["mode"] == "w"
             assert call_kwargs["samplerate"] == 16000
             assert call_kwargs["channels"] == 1
+            assert call_kwargs["subtype"] == "PCM_16"
 
         recorder.stop()
 
     def test_opens_input_stream(self, tmp_path: Path) -> None:
-        """Should open InputStream with correct parameters."""
+        """Should open RawInputStream with correct parameters."""
         recorder = AudioRecorder(temp_dir=tmp_path, sample_rate=16000, channels=1, buffer_size=1024)
 
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
         ):
             mock_stream = MagicMock()
@@ -155,7 +157,7 @@ class TestAudioRecorderStart:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
         ):
             mock_stream = MagicMock()
@@ -173,7 +175,7 @@ class TestAudioRecorderStart:
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
             patch("soundfile.SoundFile"),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
         ):
             mock_stream_cls.side_effect = sd.PortAudioError("No Default Input Device")
 
@@ -188,7 +190,7 @@ class TestAudioRecorderStart:
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
             patch("soundfile.SoundFile"),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
         ):
             mock_stream_cls.side_effect = sd.PortAudioError("Device unavailable")
 
@@ -202,7 +204,7 @@ class TestAudioRecorderStart:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
         ):
             mock_stream = MagicMock()
@@ -223,7 +225,7 @@ class TestAudioRecorderStart:
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
             patch("soundfile.SoundFile") as mock_sf,
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
         ):
             mock_file = MagicMock()
             mock_sf.return_value = mock_file
@@ -246,7 +248,7 @@ class TestAudioRecorderStop:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
         ):
             mock_stream = MagicMock()
@@ -264,7 +266,7 @@ class TestAudioRecorderStop:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
         ):
             mock_stream = MagicMock()
@@ -282,7 +284,7 @@ class TestAudioRecorderStop:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile") as mock_sf,
         ):
             mock_stream = MagicMock()
@@ -301,7 +303,7 @@ class TestAudioRecorderStop:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
         ):
             mock_stream = MagicMock()
@@ -311,6 +313,29 @@ class TestAudioRecorderStop:
 
             assert recorder.is_recording is False
 
+    def test_closes_file_when_write_fails(self, tmp_path: Path) -> None:
+        """A sink write error should propagate with the file already closed."""
+        recorder = AudioRecorder(temp_dir=tmp_path)
+
+        with (
+            patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
+            patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
+            patch("sounddevice.RawInputStream"),
+        ):
+            recorder.start()
+            file_manager = recorder._file_manager
+            assert file_manager is not None
+            with patch.object(file_manager, "write", side_effect=OSError("disk full")):
+                recorder._audio_callback(
+                    np.zeros((100, 1), dtype=np.float32), 100, {}, sd.CallbackFlags()
+                )
+                with pytest.raises(OSError, match="disk full"):
+                    recorder.stop()
+
+        assert file_manager._sound_file is None
+        recorder.release()
+        assert list(tmp_path.iterdir()) == []
+
     def test_not_started_raises_error(self) -> None:
         """Should raise RuntimeError if never started."""
         recorder = AudioRecorder()
@@ -335,7 +360,7 @@ class TestGetDuration:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
             patch("time.time") as mock_time,
         ):
@@ -358,7 +383,7 @@ class TestGetDuration:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
         ):
             mock_stream = MagicMock()
@@ -383,7 +408,7 @@ class TestAudioCallback:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile") as mock_sf,
         ):
             mock_stream = MagicMock()
@@ -410,7 +435,7 @@ class TestAudioCallback:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile") as mock_sf,
         ):
             mock_stream = MagicMock()
@@ -423,9 +448,10 @@ class TestAudioCallback:
             test_data = np.zeros((100, 1), dtype=np.float32)
             recorder._audio_callback(test_data, 100, {}, sd.CallbackFlags())
 
-            mock_file.write.assert_called()
+            # Writes happen on the writer thread; stop() drains it
+            recorder.stop()
 
-        recorder.stop()
+            mock_file.write.assert_called()
 
     def test_checks_max_duration(self, tmp_path: Path) -> None:
         """Should stop recording at max duration."""
@@ -434,7 +460,7 @@ class TestAudioCallback:
         with (
             patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
             patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile") as mock_sf,
             patch("time.time") as mock_time,
         ):
@@ -456,6 +482,19 @@ class TestAudioCallback:
 
         recorder.stop()
 
+    def test_raw_callback_views_buffer(self, tmp_path: Path) -> None:
+        """Should reshape the raw buffer to (frames, channels) without copying."""
+        recorder = AudioRecorder(temp_dir=tmp_path, channels=2)
+        raw = np.arange(8, dtype=np.float32)
+
+        with patch.object(recorder, "_audio_callback") as mock_callback:
+            recorder._raw_callback(memoryview(raw).cast("B"), 4, {}, sd.CallbackFlags())
+
+        audio = mock_callback.call_args[0][0]
+        assert audio.shape == (4, 2)
+        np.testing.assert_array_equal(audio[1], [2.0, 3.0])
+        assert np.shares_memory(audio, raw)
+
     def test_does_not_write_when_not_recording(self, tmp_path: Path) -> None:
         """Should not write when not recording."""
         recorder = AudioRecorder(temp_dir=tmp_path)
@@ -472,6 +511,145 @@ class TestAudioCallback:
             mock_file.write.assert_not_called()
 
 
+class TestWaitUntilStopped:
+    """Tests for wait_until_stopped and max-duration finalization."""
+
+    def test_times_out_while_recording(self, tmp_path: Path) -> None:
+        """Should return False when recording is still running."""
+        recorder = AudioRecorder(temp_dir=tmp_path)
+
+        with (
+            patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
+            patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
+            patch("sounddevice.RawInputStream"),
+            patch("soundfile.SoundFile"),
+        ):
+            recorder.start()
+            assert recorder.wait_until_stopped(timeout=0.01) is False
+            recorder.stop()
+            assert recorder.wait_until_stopped(timeout=0) is True
+
+    def test_max_duration_wakes_waiter_and_stop_finalizes(self, tmp_path: Path) -> None:
+        """Max duration should wake waiters, and stop() should still close everything."""
+        recorder = AudioRecorder(temp_dir=tmp_path, max_duration=5)
+
+        with (
+            patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
+            patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
+            patch("soundfile.SoundFile") as mock_sf,
+            patch("time.time") as mock_time,
+        ):
+            mock_stream = MagicMock()
+            mock_stream_cls.return_value = mock_stream
+            mock_file = MagicMock()
+            mock_file.closed = False
+            mock_sf.return_value = mock_file
+            mock_time.return_value = 100.0
+            recorder.start()
+
+            recorder._audio_callback(
+                np.zeros((100, 1), dtype=np.float32), 100, {}, sd.CallbackFlags()
+            )
+            mock_time.return_value = 106.0
+            recorder._audio_callback(
+                np.zeros((100, 1), dtype=np.float32), 100, {}, sd.CallbackFlags()
+            )
+
+            assert recorder.wait_until_stopped(timeout=0) is True
+            recorder.stop()
+
+            mock_stream.stop.assert_called_once()
+            mock_file.write.assert_called_once()
+            mock_file.close.assert_called_once()
+
+
+class TestInMemoryRecording:
+    """Tests for in_memory recording mode."""
+
+    def test_returns_recorded_samples(self, tmp_path: Path) -> None:
+        """Should return the recording as an array without creating a temp file."""
+        recorder = AudioRecorder(temp_dir=tmp_path, max_duration=5, in_memory=True)
+
+        with (
+            patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
+            patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
+            patch("sounddevice.RawInputStream"),
+            patch("soundfile.SoundFile") as mock_sf,
+        ):
+            recorder.start()
+            recorder._audio_callback(
+                np.full((100, 1), 0.5, dtype=np.float32), 100, {}, sd.CallbackFlags()
+            )
+            result = recorder.stop()
+
+        mock_sf.assert_not_called()
+        assert recorder._temp_file is None
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (100, 1)
+        np.testing.assert_array_equal(result, 0.5)
+        assert recorder.get_duration() == 100 / 16000
+
+    def test_falls_back_to_file_when_too_long(self, tmp_path: Path) -> None:
+        """Should use a temp file when max_duration exceeds the memory limit."""
+        recorder = AudioRecorder(temp_dir=tmp_path, max_duration=5, in_memory=True)
+
+        with (
+            patch("hark.recorder.recorder.MAX_IN_MEMORY_RECORDING_BYTES", 1024),
+            patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
+            patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
+            patch("sounddevice.RawInputStream"),
+            patch("soundfile.SoundFile"),
+        ):
+            recorder.start()
+            result = recorder.stop()
+
+        assert isinstance(result, Path)
+        assert recorder._memory_buffer is None
+
+
+class TestAutoStop:
+    """Tests for VAD-driven auto-stop."""
+
+    def test_stops_after_speech_then_silence(self, tmp_path: Path) -> None:
+        """Should end the recording from the writer thread once speech goes silent."""
+        recorder = AudioRecorder(temp_dir=tmp_path, in_memory=True, vad=energy_vad(-40.0))
+        loud = np.full((1600, 1), 0.5, dtype=np.float32)
+        quiet = np.zeros((1600, 1), dtype=np.float32)
+
+        with (
+            patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
+            patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
+            patch("sounddevice.RawInputStream"),
+        ):
+            recorder.start()
+            # 2s of speech, then 2s of silence (100ms blocks at 16kHz)
+            for block in [loud] * 20 + [quiet] * 20:
+                recorder._audio_callback(block, len(block), {}, sd.CallbackFlags())
+
+            assert recorder.wait_until_stopped(timeout=5.0) is True
+            assert not recorder.is_recording
+            recorder.stop()
+
+    def test_no_vad_keeps_recording(self, tmp_path: Path) -> None:
+        """Without a VAD, silence should not stop the recording."""
+        recorder = AudioRecorder(temp_dir=tmp_path, in_memory=True)
+
+        with (
+            patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
+            patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
+            patch("sounddevice.RawInputStream"),
+        ):
+            recorder.start()
+            for _ in range(40):
+                recorder._audio_callback(
+                    np.zeros((1600, 1), dtype=np.float32), 1600, {}, sd.CallbackFlags()
+                )
+
+            assert recorder.wait_until_stopped(timeout=0.05) is False
+            recorder.stop()
+
+
 class TestStaticMethods:
     """Tests for static methods."""
 
@@ -603,6 +781,64 @@ class TestCleanup:
         recorder._cleanup()
         assert recorder._stream is None
 
+    def test_release_closes_anonymous_file(self, tmp_path: Path) -> None:
+        """release should close the descriptor backing an anonymous recording."""
+        recorder = AudioRecorder(temp_dir=tmp_path, anonymous_file=True)
+
+        with (
+            patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
+            patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
+            patch("sounddevice.RawInputStream"),
+        ):
+            recorder.start()
+            recorder.stop()
+
+        assert recorder._file_manager is not None
+        fd = recorder._file_manager._fd
+        assert fd is not None
+
+        recorder.release()
+
+        assert recorder._file_manager is None
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+    def test_release_deletes_named_file(self, tmp_path: Path) -> None:
+        """release should delete a named temp file, and be safe to repeat."""
+        recorder = AudioRecorder(temp_dir=tmp_path)
+
+        with (
+            patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
+            patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
+            patch("sounddevice.RawInputStream"),
+        ):
+            recorder.start()
+            path = recorder.stop()
+
+        assert isinstance(path, Path)
+        assert path.exists()
+
+        recorder.release()
+        recorder.release()
+
+        assert not path.exists()
+
+    def test_release_drops_in_memory_samples(self, tmp_path: Path) -> None:
+        """release should drop the in-memory buffer."""
+        recorder = AudioRecorder(temp_dir=tmp_path, max_duration=5, in_memory=True)
+
+        with (
+            patch("hark.recorder.recorder.validate_source_availability", return_value=[]),
+            patch("hark.recorder.recorder.get_devices_for_source", return_value=(None, None)),
+            patch("sounddevice.RawInputStream"),
+        ):
+            recorder.start()
+            recorder.stop()
+
+        recorder.release()
+
+        assert recorder._memory_buffer is None
+
 
 class TestMicCallback:
     """Tests for _mic_callback method in dual-stream mode."""
@@ -973,7 +1209,7 @@ class TestMultiSourceRecording:
                 "hark.recorder.recorder.get_devices_for_source",
                 return_value=(None, mock_loopback),
             ),
-            patch("sounddevice.InputStream") as mock_stream_cls,
+            patch("sounddevice.RawInputStream") as mock_stream_cls,
             patch("soundfile.SoundFile"),
             patch.dict("os.environ", {}, clear=False),
         ):
@@ -0,0 +1,113 @@
+"""Tests for VAD-driven auto-stop components."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from hark.recorder import SilenceDetector, energy_vad
+
+
+def _speech_vad(frame: np.ndarray) -> bool:
+    """Treat any frame with a positive sample as speech."""
+    return bool(frame.max() > 0)
+
+
+class TestEnergyVad:
+    """Tests for energy_vad."""
+
+    def test_loud_frame_is_speech(self) -> None:
+        """Frames above the threshold should count as speech."""
+        vad = energy_vad(-40.0)
+        assert vad(np.full(512, 0.1, dtype=np.float32)) is True
+
+    def test_quiet_frame_is_silence(self) -> None:
+        """Frames below the threshold should count as silence."""
+        vad = energy_vad(-40.0)
+        assert vad(np.full(512, 0.001, dtype=np.float32)) is False
+
+    def test_empty_frame_is_silence(self) -> None:
+        """Empty frames should not count as speech."""
+        assert energy_vad()(np.array([], dtype=np.float32)) is False
+
+
+class TestSilenceDetector:
+    """Tests for SilenceDetector."""
+
+    def _make(self, on_silence: MagicMock, vad=_speech_vad) -> SilenceDetector:
+        # 100-sample frames at 1kHz are 100ms each
+        return SilenceDetector(
+            vad,
+            sample_rate=1000,
+            on_silence=on_silence,
+            frame_size=100,
+            min_speech_ms=300,
+            trailing_silence_ms=200,
+        )
+
+    def test_fires_after_speech_then_silence(self) -> None:
+        """Should fire once enough speech is followed by trailing silence."""
+        on_silence = MagicMock()
+        detector = self._make(on_silence)
+
+        detector.feed(np.ones((300, 1), dtype=np.float32))
+        detector.feed(np.zeros((100, 1), dtype=np.float32))
+        on_silence.assert_not_called()
+
+        detector.feed(np.zeros((100, 1), dtype=np.float32))
+        on_silence.assert_called_once()
+        assert detector.triggered
+
+    def test_ignores_leading_silence(self) -> None:
+        """Silence before enough speech should not fire."""
+        on_silence = MagicMock()
+        detector = self._make(on_silence)
+
+        detector.feed(np.zeros((1000, 1), dtype=np.float32))
+        detector.feed(np.ones((200, 1), dtype=np.float32))
+        detector.feed(np.zeros((1000, 1), dtype=np.float32))
+
+        on_silence.assert_not_called()
+
+    def test_speech_resets_silence(self) -> None:
+        """A speech frame should reset the trailing silence count."""
+        on_silence = MagicMock()
+        detector = self._make(on_silence)
+
+        detector.feed(np.ones((300, 1), dtype=np.float32))
+        detector.feed(np.zeros((100, 1), dtype=np.float32))
+        detector.feed(np.ones((100, 1), dtype=np.float32))
+        detector.feed(np.zeros((100, 1), dtype=np.float32))
+
+        on_silence.assert_not_called()
+
+    def test_regroups_blocks_into_frames(self) -> None:
+        """Should call the VAD with fixed-size frames regardless of block size."""
+        vad = MagicMock(return_value=True)
+        detector = self._make(MagicMock(), vad=vad)
+
+        for _ in range(5):
+            detector.feed(np.ones((70, 1), dtype=np.float32))
+
+        assert vad.call_count == 3
+        assert all(call.args[0].shape == (100,) for call in vad.call_args_list)
+
+    def test_downmixes_stereo(self) -> None:
+        """Should pass mono frames to the VAD for multi-channel input."""
+        vad = MagicMock(return_value=False)
+        detector = self._make(MagicMock(), vad=vad)
+
+        stereo = np.column_stack([np.ones(100), -np.ones(100)]).astype(np.float32)
+        detector.feed(stereo)
+
+        np.testing.assert_array_equal(vad.call_args.args[0], np.zeros(100))
+
+    def test_fires_only_once(self) -> None:
+        """Should not call on_silence again after triggering."""
+        on_silence = MagicMock()
+        detector = self._make(on_silence)
+
+        detector.feed(np.ones((300, 1), dtype=np.float32))
+        detector.feed(np.zeros((1000, 1), dtype=np.float32))
+        detector.feed(np.zeros((1000, 1), dtype=np.float32))
+
+        on_silence.assert_called_once()
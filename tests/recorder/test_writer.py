@@ -0,0 +1,172 @@
+"""Tests for RecordingWriter component."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from hark.recorder import RecordingFileManager, RecordingWriter
+
+
+def _make_file_manager(tmp_path: Path, channels: int = 1) -> tuple[RecordingFileManager, MagicMock]:
+    """Create a file manager backed by a mock sound file."""
+    file_manager = RecordingFileManager(tmp_path, 16000, channels)
+    mock_file = MagicMock()
+    mock_file.closed = False
+    file_manager._sound_file = mock_file
+    return file_manager, mock_file
+
+
+class TestRecordingWriterInit:
+    """Tests for RecordingWriter initialization."""
+
+    def test_preallocates_pool(self, tmp_path: Path) -> None:
+        """Should fill the free-list with float32 buffers."""
+        file_manager, _ = _make_file_manager(tmp_path, channels=2)
+        writer = RecordingWriter(file_manager, block_size=128, channels=2, pool_size=4)
+
+        assert writer._free.qsize() == 4
+        buf = writer._free.get_nowait()
+        assert buf.shape == (128, 2)
+        assert buf.dtype == np.float32
+
+    def test_initial_state(self, tmp_path: Path) -> None:
+        """Should not start a thread on init."""
+        file_manager, _ = _make_file_manager(tmp_path)
+        writer = RecordingWriter(file_manager, block_size=128, channels=1)
+        assert writer._thread is None
+
+
+class TestRecordingWriterPush:
+    """Tests for RecordingWriter.push."""
+
+    def test_copies_data(self, tmp_path: Path) -> None:
+        """Should copy data so the caller's buffer can be reused."""
+        file_manager, mock_file = _make_file_manager(tmp_path)
+        writer = RecordingWriter(file_manager, block_size=4, channels=1)
+
+        data = np.array([[0.5], [0.5]], dtype=np.float32)
+        writer.push(data)
+        data[:] = 0.0
+        writer.stop()
+
+        written = mock_file.write.call_args[0][0]
+        np.testing.assert_array_equal(written, [[0.5], [0.5]])
+
+    def test_splits_oversized_blocks(self, tmp_path: Path) -> None:
+        """Should split data larger than a pooled buffer."""
+        file_manager, mock_file = _make_file_manager(tmp_path)
+        writer = RecordingWriter(file_manager, block_size=4, channels=1)
+
+        writer.push(np.arange(10, dtype=np.float32).reshape(-1, 1))
+        writer.stop()
+
+        assert mock_file.write.call_count == 3
+        assert file_manager.frames_written == 10
+
+    def test_grows_pool_when_exhausted(self, tmp_path: Path) -> None:
+        """Should not drop audio when the free-list is empty."""
+        file_manager, _ = _make_file_manager(tmp_path)
+        writer = RecordingWriter(file_manager, block_size=4, channels=1, pool_size=1)
+
+        for _ in range(3):
+            writer.push(np.ones((4, 1), dtype=np.float32))
+        writer.stop()
+
+        assert file_manager.frames_written == 12
+
+
+class TestRecordingWriterStartStop:
+    """Tests for RecordingWriter start/stop methods."""
+
+    def test_start_creates_thread(self, tmp_path: Path) -> None:
+        """Should create and start a daemon writer thread."""
+        file_manager, _ = _make_file_manager(tmp_path)
+        writer = RecordingWriter(file_manager, block_size=4, channels=1)
+
+        writer.start()
+
+        assert writer._thread is not None
+        assert writer._thread.is_alive()
+        assert writer._thread.daemon
+
+        writer.stop()
+
+    def test_stop_drains_queue(self, tmp_path: Path) -> None:
+        """Should write all queued blocks before returning."""
+        file_manager, mock_file = _make_file_manager(tmp_path)
+        writer = RecordingWriter(file_manager, block_size=4, channels=1)
+
+        writer.start()
+        for _ in range(5):
+            writer.push(np.zeros((4, 1), dtype=np.float32))
+        writer.stop()
+
+        assert writer._thread is None
+        assert mock_file.write.call_count == 5
+        assert file_manager.frames_written == 20
+
+    def test_calls_on_block_after_write(self, tmp_path: Path) -> None:
+        """Should pass each written block to the on_block hook."""
+        file_manager, _ = _make_file_manager(tmp_path)
+        blocks: list[np.ndarray] = []
+        writer = RecordingWriter(
+            file_manager,
+            block_size=4,
+            channels=1,
+            on_block=lambda block: blocks.append(block.copy()),
+        )
+
+        writer.push(np.arange(6, dtype=np.float32).reshape(-1, 1))
+        writer.stop()
+
+        assert [len(b) for b in blocks] == [4, 2]
+        np.testing.assert_array_equal(blocks[1], [[4.0], [5.0]])
+
+    def test_recycles_buffers(self, tmp_path: Path) -> None:
+        """Should return written buffers to the free-list."""
+        file_manager, _ = _make_file_manager(tmp_path)
+        writer = RecordingWriter(file_manager, block_size=4, channels=1, pool_size=2)
+
+        writer.push(np.zeros((4, 1), dtype=np.float32))
+        writer.stop()
+
+        assert writer._free.qsize() == 2
+
+
+class TestRecordingWriterErrors:
+    """Tests for RecordingWriter failure handling."""
+
+    def test_on_block_error_disables_hook_and_keeps_writing(self, tmp_path: Path) -> None:
+        """A raising on_block should be disabled while every frame is still written."""
+        file_manager, mock_file = _make_file_manager(tmp_path)
+        error = ValueError("vad failed")
+        on_block = MagicMock(side_effect=error)
+        writer = RecordingWriter(file_manager, block_size=4, channels=1, on_block=on_block)
+
+        writer.start()
+        for _ in range(5):
+            writer.push(np.ones((4, 1), dtype=np.float32))
+        writer.stop()
+
+        assert mock_file.write.call_count == 5
+        assert file_manager.frames_written == 20
+        on_block.assert_called_once()
+        assert writer.on_block_error is error
+
+    def test_write_error_raised_from_stop(self, tmp_path: Path) -> None:
+        """A sink failure should keep draining and be re-raised by stop()."""
+        sink = MagicMock()
+        sink.write.side_effect = RuntimeError("sink failed")
+        writer = RecordingWriter(sink, block_size=4, channels=1, pool_size=2)
+
+        for _ in range(3):
+            writer.push(np.zeros((4, 1), dtype=np.float32))
+
+        with pytest.raises(RuntimeError, match="sink failed"):
+            writer.stop()
+
+        # Later blocks are discarded rather than written after a gap
+        sink.write.assert_called_once()
+        assert writer._free.qsize() == 3
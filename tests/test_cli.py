@@ -1,19 +1,32 @@
 """Tests for hark.cli module."""
 
+import io
+import json
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
-from hark.cli import create_parser, main, run_workflow
+from hark.cli import (
+    _get_parser,
+    _transcribe_audio,
+    _write_output,
+    create_parser,
+    main,
+    run_workflow,
+)
 from hark.config import HarkConfig
 from hark.constants import (
     EXIT_ERROR,
     EXIT_INTERRUPT,
     EXIT_SUCCESS,
 )
-from hark.exceptions import HarkError
+from hark.exceptions import HarkError, PreprocessingError
 
 
 class TestCreateParser:
@@ -48,6 +61,19 @@ class TestCreateParser:
         assert args.max_duration == 300
         assert args.sample_rate == 48000
         assert args.channels == 2
+        assert args.auto_stop is False
+
+    def test_events_option(self) -> None:
+        """--events should take a file path."""
+        parser = create_parser()
+        args = parser.parse_args(["--events", "progress.jsonl"])
+        assert args.events == "progress.jsonl"
+
+    def test_auto_stop_option(self) -> None:
+        """--auto-stop should be parsed as a flag."""
+        parser = create_parser()
+        args = parser.parse_args(["--auto-stop"])
+        assert args.auto_stop is True
 
     def test_input_source_option(self) -> None:
         """--input option should be parsed correctly."""
@@ -160,6 +186,71 @@ class TestCreateParser:
         assert exc_info.value.code == 0
 
 
+class TestParserCache:
+    """Tests for the shared parser used by main()."""
+
+    def test_main_reuses_parser(self) -> None:
+        """Repeated main() calls should build the parser only once."""
+        _get_parser.cache_clear()
+        with (
+            patch("hark.cli.create_parser", wraps=create_parser) as mock_create,
+            pytest.raises(SystemExit),
+        ):
+            main(["--version"])
+        with pytest.raises(SystemExit):
+            main(["--version"])
+
+        assert mock_create.call_count == 1
+        _get_parser.cache_clear()
+
+    def test_shared_parser_parses_independently(self) -> None:
+        """Parsing with the shared parser should not leak state between calls."""
+        parser = _get_parser()
+        first = parser.parse_args(["--model", "small", "out.txt"])
+        second = parser.parse_args([])
+
+        assert first.model == "small"
+        assert second.model is None
+        assert second.output_file is None
+
+    def test_create_parser_returns_fresh_parser(self) -> None:
+        """create_parser should not hand out the shared instance."""
+        assert create_parser() is not create_parser()
+        assert create_parser() is not _get_parser()
+
+
+class TestImportCost:
+    """Tests for CLI module import cost."""
+
+    def test_import_skips_heavy_modules(self) -> None:
+        """Importing hark.cli should not load audio or numeric libraries."""
+        code = (
+            "import sys, hark.cli; "
+            "heavy = {'numpy', 'sounddevice', 'soundfile', 'faster_whisper'}; "
+            "print(sorted(heavy & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_version_skips_heavy_modules(self) -> None:
+        """Running --version through main() should not load numpy."""
+        code = (
+            "import sys\n"
+            "from hark.cli import main\n"
+            "try:\n"
+            "    main(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('numpy' in sys.modules, file=sys.stderr)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stderr.strip() == "False"
+
+
 class TestMain:
     """Tests for main function."""
 
@@ -318,7 +409,7 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = side_effect
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False  # Stop immediately
                 mock_recorder.get_duration.return_value = 0.1
@@ -347,7 +438,7 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 0.1
@@ -371,7 +462,7 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" "] + [None] * 10
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 type(mock_recorder).is_recording = property(lambda self: is_recording_side_effect())
                 mock_recorder.get_duration.return_value = 1.0
@@ -379,14 +470,14 @@ class TestRunWorkflow:
                 mock_recorder_cls.return_value = mock_recorder
 
                 with patch("time.sleep"):
-                    with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                    with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                         mock_prep = MagicMock()
                         mock_result = MagicMock()
                         mock_result.silence_trimmed_seconds = 0.0
                         mock_prep.process.return_value = (np.zeros(1000), mock_result)
                         mock_prep_cls.return_value = mock_prep
 
-                        with patch("hark.cli.Transcriber") as mock_trans_cls:
+                        with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                             mock_trans = MagicMock()
                             mock_trans_result = MagicMock()
                             mock_trans_result.text = "Test"
@@ -396,7 +487,7 @@ class TestRunWorkflow:
                             mock_trans.transcribe.return_value = mock_trans_result
                             mock_trans_cls.return_value = mock_trans
 
-                            with patch("hark.cli.get_formatter") as mock_fmt:
+                            with patch("hark.formatter.get_formatter") as mock_fmt:
                                 mock_fmt.return_value.format.return_value = "Test"
 
                                 run_workflow(default_config, None, mock_ui, verbose=False)
@@ -412,21 +503,21 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -436,7 +527,7 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_formatter:
+                        with patch("hark.formatter.get_formatter") as mock_formatter:
                             mock_formatter.return_value.format.return_value = "Test"
 
                             run_workflow(default_config, None, mock_ui, verbose=False)
@@ -450,7 +541,7 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 0.1  # Too short
@@ -469,21 +560,21 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -493,7 +584,7 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Test"
 
                             run_workflow(default_config, None, mock_ui, verbose=False)
@@ -509,21 +600,21 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -533,7 +624,7 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Test"
 
                             run_workflow(default_config, None, mock_ui, verbose=False)
@@ -547,21 +638,21 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -571,13 +662,111 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Test"
 
                             run_workflow(default_config, None, mock_ui, verbose=False)
 
                         mock_trans.load_model.assert_called_once()
 
+    def test_loads_model_during_preprocessing(
+        self, default_config: HarkConfig, mock_ui: MagicMock
+    ) -> None:
+        """Model load should run concurrently with preprocessing."""
+        model_loading = threading.Event()
+        preprocess_done = threading.Event()
+
+        def load_model() -> None:
+            model_loading.set()
+            # Blocks until preprocessing finishes, so a serial pipeline would deadlock
+            assert preprocess_done.wait(timeout=5)
+
+        def process(**kwargs):
+            assert model_loading.wait(timeout=5)
+            preprocess_done.set()
+            mock_result = MagicMock()
+            mock_result.silence_trimmed_seconds = 0.0
+            return np.zeros(1000), mock_result
+
+        with patch("hark.cli.KeypressHandler") as mock_keys:
+            mock_handler = MagicMock()
+            mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
+            mock_keys.return_value.__enter__.return_value = mock_handler
+
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
+                mock_recorder = MagicMock()
+                mock_recorder.is_recording = False
+                mock_recorder.get_duration.return_value = 5.0
+                mock_recorder.stop.return_value = Path("/tmp/test.wav")
+                mock_recorder_cls.return_value = mock_recorder
+
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
+                    mock_prep_cls.return_value.process.side_effect = process
+
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
+                        mock_trans = MagicMock()
+                        mock_trans.load_model.side_effect = load_model
+                        mock_trans_result = MagicMock()
+                        mock_trans_result.text = "Test"
+                        mock_trans_result.language = "en"
+                        mock_trans_result.language_probability = 0.9
+                        mock_trans_result.duration = 5.0
+                        mock_trans.transcribe.return_value = mock_trans_result
+                        mock_trans_cls.return_value = mock_trans
+
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
+                            mock_fmt.return_value.format.return_value = "Test"
+
+                            result = run_workflow(default_config, None, mock_ui, verbose=False)
+
+        assert result == EXIT_SUCCESS
+        mock_trans.transcribe.assert_called_once()
+
+    def test_preprocessing_error_does_not_wait_for_model_load(
+        self, default_config: HarkConfig, mock_ui: MagicMock
+    ) -> None:
+        """A failed run should return while the model is still loading."""
+        model_loading = threading.Event()
+        release_load = threading.Event()
+
+        def load_model() -> None:
+            model_loading.set()
+            release_load.wait(timeout=5)
+
+        def process(**kwargs):
+            assert model_loading.wait(timeout=5)
+            raise PreprocessingError("boom")
+
+        try:
+            with patch("hark.cli.KeypressHandler") as mock_keys:
+                mock_handler = MagicMock()
+                mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
+                mock_keys.return_value.__enter__.return_value = mock_handler
+
+                with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
+                    mock_recorder = MagicMock()
+                    mock_recorder.is_recording = False
+                    mock_recorder.get_duration.return_value = 5.0
+                    mock_recorder.stop.return_value = Path("/tmp/test.wav")
+                    mock_recorder_cls.return_value = mock_recorder
+
+                    with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
+                        mock_prep_cls.return_value.process.side_effect = process
+
+                        with patch("hark.transcriber.Transcriber") as mock_trans_cls:
+                            mock_trans_cls.return_value.load_model.side_effect = load_model
+
+                            with pytest.raises(PreprocessingError):
+                                run_workflow(default_config, None, mock_ui, verbose=False)
+
+            # run_workflow came back while load_model was still blocked
+            assert not release_load.is_set()
+            loaders = [t for t in threading.enumerate() if t.name == "hark-model-load"]
+            assert loaders
+            assert all(t.daemon for t in loaders)
+        finally:
+            release_load.set()
+
     def test_transcribes_audio(self, default_config: HarkConfig, mock_ui: MagicMock) -> None:
         """Should transcribe audio."""
         with patch("hark.cli.KeypressHandler") as mock_keys:
@@ -585,14 +774,14 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
@@ -600,7 +789,7 @@ class TestRunWorkflow:
                     mock_prep.process.return_value = (processed_audio, mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -610,7 +799,7 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Test"
 
                             run_workflow(default_config, None, mock_ui, verbose=False)
@@ -627,21 +816,21 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -651,7 +840,7 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_formatter = MagicMock()
                             mock_formatter.format.return_value = "Formatted output"
                             mock_fmt.return_value = mock_formatter
@@ -672,21 +861,21 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test transcription"
@@ -696,7 +885,7 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Formatted text"
 
                             run_workflow(default_config, str(output_file), mock_ui, verbose=False)
@@ -712,21 +901,21 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -736,7 +925,7 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Stdout output"
 
                             run_workflow(default_config, None, mock_ui, verbose=False)
@@ -744,6 +933,152 @@ class TestRunWorkflow:
         captured = capsys.readouterr()
         assert "Stdout output" in captured.out
 
+    def test_writes_stdout_as_single_encoded_payload(
+        self, default_config: HarkConfig, mock_ui: MagicMock
+    ) -> None:
+        """Should write the output and trailing newline to stdout's buffer in one call."""
+        writes: list[bytes] = []
+
+        class RecordingBytesIO(io.BytesIO):
+            def write(self, data) -> int:  # type: ignore[override]
+                writes.append(bytes(data))
+                return super().write(data)
+
+        stdout = io.TextIOWrapper(RecordingBytesIO(), encoding="utf-8")
+
+        with (
+            patch("hark.formatter.get_formatter") as mock_fmt,
+            patch("sys.stdout", stdout),
+            patch("hark.cli.os.linesep", "\n"),
+        ):
+            mock_fmt.return_value.format.return_value = "Café"
+            _write_output(mock_ui, default_config, MagicMock(), None)
+
+        assert writes == ["Café\n".encode()]
+
+    def test_stdout_uses_stream_encoding_and_error_handler(
+        self, default_config: HarkConfig, mock_ui: MagicMock
+    ) -> None:
+        """Should encode with stdout's encoding and errors, not the file output encoding."""
+        buffer = io.BytesIO()
+        stdout = io.TextIOWrapper(buffer, encoding="ascii", errors="backslashreplace")
+
+        with (
+            patch("hark.formatter.get_formatter") as mock_fmt,
+            patch("sys.stdout", stdout),
+            patch("hark.cli.os.linesep", "\n"),
+        ):
+            mock_fmt.return_value.format.return_value = "Café"
+            _write_output(mock_ui, default_config, MagicMock(), None)
+
+        assert buffer.getvalue() == b"Caf\\xe9\n"
+
+    def test_stdout_unencodable_output_raises_before_writing(
+        self, default_config: HarkConfig, mock_ui: MagicMock
+    ) -> None:
+        """A strict stdout should fail like print() without writing partial output."""
+        buffer = io.BytesIO()
+        stdout = io.TextIOWrapper(buffer, encoding="ascii", errors="strict")
+
+        with (
+            patch("hark.formatter.get_formatter") as mock_fmt,
+            patch("sys.stdout", stdout),
+        ):
+            mock_fmt.return_value.format.return_value = "Café"
+            with pytest.raises(UnicodeEncodeError):
+                _write_output(mock_ui, default_config, MagicMock(), None)
+
+        assert buffer.getvalue() == b""
+
+    def test_stdout_keeps_platform_line_endings(
+        self, default_config: HarkConfig, mock_ui: MagicMock
+    ) -> None:
+        """Should translate newlines like a text-mode stdout would."""
+        buffer = io.BytesIO()
+        stdout = io.TextIOWrapper(buffer, encoding="utf-8")
+
+        with (
+            patch("hark.formatter.get_formatter") as mock_fmt,
+            patch("sys.stdout", stdout),
+            patch("hark.cli.os.linesep", "\r\n"),
+        ):
+            mock_fmt.return_value.format.return_value = "One\nTwo"
+            _write_output(mock_ui, default_config, MagicMock(), None)
+
+        assert buffer.getvalue() == b"One\r\nTwo\r\n"
+
+    def test_appends_encoded_output_to_file(
+        self, default_config: HarkConfig, mock_ui: MagicMock, tmp_path: Path
+    ) -> None:
+        """Should append the encoded output plus a newline in append mode."""
+        output_file = tmp_path / "out.txt"
+        output_file.write_bytes(b"Earlier\n")
+        default_config.output.append_mode = True
+
+        with (
+            patch("hark.formatter.get_formatter") as mock_fmt,
+            patch("hark.cli.os.linesep", "\n"),
+        ):
+            mock_fmt.return_value.format.return_value = "Café"
+            _write_output(mock_ui, default_config, MagicMock(), str(output_file))
+
+        assert output_file.read_bytes() == "Earlier\nCafé\n".encode()
+
+    @pytest.mark.parametrize("encoding", ["utf-16", "utf-8-sig"])
+    def test_append_writes_bom_only_once(
+        self, default_config: HarkConfig, mock_ui: MagicMock, tmp_path: Path, encoding: str
+    ) -> None:
+        """Appending should not repeat the BOM, matching a text-mode append."""
+        output_file = tmp_path / "out.txt"
+        expected_file = tmp_path / "expected.txt"
+        default_config.output.append_mode = True
+        default_config.output.encoding = encoding
+
+        with (
+            patch("hark.formatter.get_formatter") as mock_fmt,
+            patch("hark.cli.os.linesep", "\n"),
+        ):
+            mock_fmt.return_value.format.return_value = "Café"
+            _write_output(mock_ui, default_config, MagicMock(), str(output_file))
+            _write_output(mock_ui, default_config, MagicMock(), str(output_file))
+
+        for _ in range(2):
+            with expected_file.open("a", encoding=encoding, newline="\n") as f:
+                f.write("Café\n")
+
+        assert output_file.read_bytes() == expected_file.read_bytes()
+        assert output_file.read_text(encoding=encoding) == "Café\nCafé\n"
+
+    def test_file_output_keeps_platform_line_endings(
+        self, default_config: HarkConfig, mock_ui: MagicMock, tmp_path: Path
+    ) -> None:
+        """Should write the platform line separator like a text-mode file would."""
+        output_file = tmp_path / "out.txt"
+
+        with (
+            patch("hark.formatter.get_formatter") as mock_fmt,
+            patch("hark.cli.os.linesep", "\r\n"),
+        ):
+            mock_fmt.return_value.format.return_value = "One\nTwo"
+            _write_output(mock_ui, default_config, MagicMock(), str(output_file))
+
+        assert output_file.read_bytes() == b"One\r\nTwo"
+
+    def test_writes_stdout_without_byte_buffer(
+        self, default_config: HarkConfig, mock_ui: MagicMock
+    ) -> None:
+        """Should fall back to a text write when stdout has no byte buffer."""
+        stdout = io.StringIO()
+
+        with (
+            patch("hark.formatter.get_formatter") as mock_fmt,
+            patch("sys.stdout", stdout),
+        ):
+            mock_fmt.return_value.format.return_value = "Plain"
+            _write_output(mock_ui, default_config, MagicMock(), None)
+
+        assert stdout.getvalue() == "Plain\n"
+
     def test_transcription_complete_message(
         self, default_config: HarkConfig, mock_ui: MagicMock
     ) -> None:
@@ -753,21 +1088,21 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -777,7 +1112,7 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Test"
 
                             run_workflow(default_config, None, mock_ui, verbose=False)
@@ -787,7 +1122,7 @@ class TestRunWorkflow:
     def test_cleans_up_temp_file(
         self, default_config: HarkConfig, mock_ui: MagicMock, tmp_path: Path
     ) -> None:
-        """Should clean up temp file."""
+        """Should clean up the temp file through the recorder."""
         temp_file = tmp_path / "recording.wav"
         temp_file.touch()
 
@@ -796,21 +1131,22 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = temp_file
+                mock_recorder.release.side_effect = temp_file.unlink
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -820,13 +1156,103 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Test"
 
                             run_workflow(default_config, None, mock_ui, verbose=False)
 
+        mock_recorder.release.assert_called_once()
         assert not temp_file.exists()
 
+    def test_releases_recording_when_stop_fails(
+        self, default_config: HarkConfig, mock_ui: MagicMock
+    ) -> None:
+        """Should release the recording if stopping the recorder raises."""
+        with patch("hark.cli.KeypressHandler") as mock_keys:
+            mock_handler = MagicMock()
+            mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
+            mock_keys.return_value.__enter__.return_value = mock_handler
+
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
+                mock_recorder = MagicMock()
+                mock_recorder.is_recording = False
+                mock_recorder.stop.side_effect = OSError("disk full")
+                mock_recorder_cls.return_value = mock_recorder
+
+                with pytest.raises(OSError, match="disk full"):
+                    run_workflow(default_config, None, mock_ui, verbose=False)
+
+        mock_recorder.release.assert_called_once()
+
+    def test_releases_recording_when_preprocessing_fails(
+        self, default_config: HarkConfig, mock_ui: MagicMock
+    ) -> None:
+        """Should release the recording even if the workflow fails after recording."""
+        with patch("hark.cli.KeypressHandler") as mock_keys:
+            mock_handler = MagicMock()
+            mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
+            mock_keys.return_value.__enter__.return_value = mock_handler
+
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
+                mock_recorder = MagicMock()
+                mock_recorder.is_recording = False
+                mock_recorder.get_duration.return_value = 5.0
+                mock_recorder.stop.return_value = Path("/proc/self/fd/99")
+                mock_recorder_cls.return_value = mock_recorder
+
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
+                    mock_prep_cls.return_value.process.side_effect = PreprocessingError("boom")
+
+                    with patch("hark.transcriber.Transcriber"):
+                        with pytest.raises(PreprocessingError):
+                            run_workflow(default_config, None, mock_ui, verbose=False)
+
+        mock_recorder.release.assert_called_once()
+
+    def test_passes_in_memory_recording_to_preprocessor(
+        self, default_config: HarkConfig, mock_ui: MagicMock
+    ) -> None:
+        """Should record in memory and hand the samples straight to preprocessing."""
+        recording = np.zeros((16000, 1), dtype=np.float32)
+
+        with patch("hark.cli.KeypressHandler") as mock_keys:
+            mock_handler = MagicMock()
+            mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
+            mock_keys.return_value.__enter__.return_value = mock_handler
+
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
+                mock_recorder = MagicMock()
+                mock_recorder.is_recording = False
+                mock_recorder.get_duration.return_value = 5.0
+                mock_recorder.stop.return_value = recording
+                mock_recorder_cls.return_value = mock_recorder
+
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
+                    mock_prep = MagicMock()
+                    mock_result = MagicMock()
+                    mock_result.silence_trimmed_seconds = 0.0
+                    mock_prep.process.return_value = (np.zeros(1000), mock_result)
+                    mock_prep_cls.return_value = mock_prep
+
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
+                        mock_trans = MagicMock()
+                        mock_trans_result = MagicMock()
+                        mock_trans_result.text = "Test"
+                        mock_trans_result.language = "en"
+                        mock_trans_result.language_probability = 0.9
+                        mock_trans_result.duration = 5.0
+                        mock_trans.transcribe.return_value = mock_trans_result
+                        mock_trans_cls.return_value = mock_trans
+
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
+                            mock_fmt.return_value.format.return_value = "Test"
+
+                            result = run_workflow(default_config, None, mock_ui, verbose=False)
+
+        assert result == 0
+        assert mock_recorder_cls.call_args.kwargs["in_memory"] is True
+        assert mock_prep.process.call_args.kwargs["audio_path"] is recording
+
     def test_returns_success(self, default_config: HarkConfig, mock_ui: MagicMock) -> None:
         """Should return EXIT_SUCCESS on success."""
         with patch("hark.cli.KeypressHandler") as mock_keys:
@@ -834,21 +1260,21 @@ class TestRunWorkflow:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -858,7 +1284,7 @@ class TestRunWorkflow:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Test"
 
                             result = run_workflow(default_config, None, mock_ui, verbose=False)
@@ -866,6 +1292,55 @@ class TestRunWorkflow:
         assert result == EXIT_SUCCESS
 
 
+class TestTranscribeAudio:
+    """Tests for _transcribe_audio progress reporting."""
+
+    @pytest.fixture
+    def mock_ui(self) -> MagicMock:
+        """Create mock UI."""
+        return MagicMock()
+
+    @staticmethod
+    def _make_transcriber() -> MagicMock:
+        def transcribe(**kwargs) -> MagicMock:
+            kwargs["progress_callback"](0.5)
+            kwargs["progress_callback"](1.0)
+            return MagicMock()
+
+        transcriber = MagicMock()
+        transcriber.transcribe.side_effect = transcribe
+        return transcriber
+
+    @staticmethod
+    def _loaded() -> Future[None]:
+        future: Future[None] = Future()
+        future.set_result(None)
+        return future
+
+    def test_reports_progress_to_ui(self, default_config: HarkConfig, mock_ui: MagicMock) -> None:
+        """Should drive the UI progress bar when no events file is set."""
+        _transcribe_audio(
+            mock_ui, default_config, np.zeros(100), self._make_transcriber(), self._loaded()
+        )
+
+        assert mock_ui.transcription_progress.call_count == 2
+
+    def test_writes_progress_events(
+        self, default_config: HarkConfig, mock_ui: MagicMock, tmp_path: Path
+    ) -> None:
+        """Should write progress to the events file instead of the UI."""
+        events_path = tmp_path / "events.jsonl"
+        default_config.output.events_path = events_path
+
+        _transcribe_audio(
+            mock_ui, default_config, np.zeros(100), self._make_transcriber(), self._loaded()
+        )
+
+        mock_ui.transcription_progress.assert_not_called()
+        lines = events_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["progress"] for line in lines] == [0.5, 1.0]
+
+
 class TestLanguageHandling:
     """Tests for language handling in run_workflow."""
 
@@ -884,21 +1359,21 @@ class TestLanguageHandling:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -908,7 +1383,7 @@ class TestLanguageHandling:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Test"
 
                             run_workflow(config, None, mock_ui, verbose=False)
@@ -926,21 +1401,21 @@ class TestLanguageHandling:
             mock_handler.get_key.side_effect = [" ", KeyboardInterrupt]
             mock_keys.return_value.__enter__.return_value = mock_handler
 
-            with patch("hark.cli.AudioRecorder") as mock_recorder_cls:
+            with patch("hark.recorder.AudioRecorder") as mock_recorder_cls:
                 mock_recorder = MagicMock()
                 mock_recorder.is_recording = False
                 mock_recorder.get_duration.return_value = 5.0
                 mock_recorder.stop.return_value = Path("/tmp/test.wav")
                 mock_recorder_cls.return_value = mock_recorder
 
-                with patch("hark.cli.AudioPreprocessor") as mock_prep_cls:
+                with patch("hark.preprocessor.AudioPreprocessor") as mock_prep_cls:
                     mock_prep = MagicMock()
                     mock_result = MagicMock()
                     mock_result.silence_trimmed_seconds = 0.0
                     mock_prep.process.return_value = (np.zeros(1000), mock_result)
                     mock_prep_cls.return_value = mock_prep
 
-                    with patch("hark.cli.Transcriber") as mock_trans_cls:
+                    with patch("hark.transcriber.Transcriber") as mock_trans_cls:
                         mock_trans = MagicMock()
                         mock_trans_result = MagicMock()
                         mock_trans_result.text = "Test"
@@ -950,7 +1425,7 @@ class TestLanguageHandling:
                         mock_trans.transcribe.return_value = mock_trans_result
                         mock_trans_cls.return_value = mock_trans
 
-                        with patch("hark.cli.get_formatter") as mock_fmt:
+                        with patch("hark.formatter.get_formatter") as mock_fmt:
                             mock_fmt.return_value.format.return_value = "Test"
 
                             run_workflow(config, None, mock_ui, verbose=False)
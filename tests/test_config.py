@@ -50,6 +50,7 @@ class TestDataclassDefaults:
         assert config.channels == DEFAULT_CHANNELS
         assert config.max_duration == DEFAULT_MAX_DURATION
         assert config.input_source == DEFAULT_INPUT_SOURCE
+        assert config.auto_stop is False
 
     def test_whisper_config_defaults(self) -> None:
         """WhisperConfig should have correct default values."""
@@ -94,6 +95,7 @@ class TestDataclassDefaults:
         assert config.timestamps is False
         assert config.append_mode is False
         assert config.encoding == "utf-8"
+        assert config.events_path is None
 
     def test_interface_config_defaults(self) -> None:
         """InterfaceConfig should have correct default values."""
@@ -151,6 +153,13 @@ class TestLoadConfig:
         assert config.whisper.model == "base"
         assert config.recording.sample_rate == 16000
 
+    def test_events_path_parsed(self, tmp_path: Path) -> None:
+        """output.events_path should be parsed as an expanded Path."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("output:\n  events_path: ~/events.jsonl\n")
+        config = load_config(config_file)
+        assert config.output.events_path == Path("~/events.jsonl").expanduser()
+
     def test_partial_yaml_uses_defaults(self, tmp_path: Path, partial_config_yaml: str) -> None:
         """Missing sections should use defaults."""
         config_file = tmp_path / "partial.yaml"
@@ -205,6 +214,11 @@ class TestMergeCliArgs:
         config = merge_cli_args(default_config, cli_args_namespace)
         assert config.recording.max_duration == 120
 
+    def test_auto_stop_flag(self, default_config: HarkConfig) -> None:
+        """--auto-stop should enable auto stop."""
+        config = merge_cli_args(default_config, argparse.Namespace(auto_stop=True))
+        assert config.recording.auto_stop is True
+
     def test_whisper_options_override(
         self, default_config: HarkConfig, cli_args_namespace: argparse.Namespace
     ) -> None:
@@ -235,6 +249,11 @@ class TestMergeCliArgs:
         assert config.output.timestamps is True
         assert config.output.format == "markdown"
 
+    def test_events_option_override(self, default_config: HarkConfig) -> None:
+        """--events should set the events path."""
+        config = merge_cli_args(default_config, argparse.Namespace(events="progress.jsonl"))
+        assert config.output.events_path == Path("progress.jsonl")
+
     def test_interface_options_override(
         self, default_config: HarkConfig, cli_args_namespace: argparse.Namespace
     ) -> None:
@@ -203,6 +203,12 @@ class TestSoundDeviceContracts:
 
         assert hasattr(sd, "InputStream"), "sounddevice.InputStream not found"
 
+    def test_raw_input_stream_exists(self) -> None:
+        """Verify RawInputStream class exists."""
+        import sounddevice as sd
+
+        assert hasattr(sd, "RawInputStream"), "sounddevice.RawInputStream not found"
+
     def test_query_devices_exists(self) -> None:
         """Verify query_devices function exists."""
         import sounddevice as sd
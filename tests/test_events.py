@@ -0,0 +1,78 @@
+"""Tests for hark.events module."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from hark.events import ProgressEventLog
+
+
+def _read_events(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestProgressEventLog:
+    """Tests for ProgressEventLog."""
+
+    def test_writes_json_lines(self, tmp_path: Path) -> None:
+        """Should append one JSON object per event."""
+        path = tmp_path / "events.jsonl"
+
+        with ProgressEventLog(path, min_interval=0.0) as events:
+            events.emit(0.25)
+            events.emit(0.5)
+
+        records = _read_events(path)
+        assert [r["progress"] for r in records] == [0.25, 0.5]
+        assert all(isinstance(r["ts"], float) for r in records)
+
+    def test_appends_to_existing_file(self, tmp_path: Path) -> None:
+        """Should keep events from earlier runs."""
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"ts": 0.0, "progress": 1.0}\n', encoding="utf-8")
+
+        with ProgressEventLog(path, min_interval=0.0) as events:
+            events.emit(0.5)
+
+        assert len(_read_events(path)) == 2
+
+    def test_creates_parent_directory(self, tmp_path: Path) -> None:
+        """Should create missing parent directories."""
+        path = tmp_path / "nested" / "events.jsonl"
+
+        with ProgressEventLog(path) as events:
+            events.emit(0.1)
+
+        assert path.exists()
+
+    def test_throttles_events(self, tmp_path: Path) -> None:
+        """Should drop events arriving faster than min_interval."""
+        path = tmp_path / "events.jsonl"
+
+        with patch("hark.events.time.monotonic") as mock_monotonic:
+            with ProgressEventLog(path, min_interval=0.1) as events:
+                mock_monotonic.return_value = 10.0
+                events.emit(0.1)
+                mock_monotonic.return_value = 10.05
+                events.emit(0.2)  # dropped
+                mock_monotonic.return_value = 10.2
+                events.emit(0.3)
+
+        assert [r["progress"] for r in _read_events(path)] == [0.1, 0.3]
+
+    def test_always_writes_completion(self, tmp_path: Path) -> None:
+        """Should write progress 1.0 even inside the throttle window."""
+        path = tmp_path / "events.jsonl"
+
+        with patch("hark.events.time.monotonic", return_value=10.0):
+            with ProgressEventLog(path, min_interval=0.1) as events:
+                events.emit(0.9)
+                events.emit(1.0)
+
+        assert [r["progress"] for r in _read_events(path)] == [0.9, 1.0]
+
+    def test_emit_outside_context_is_noop(self, tmp_path: Path) -> None:
+        """Should ignore events when the file is not open."""
+        path = tmp_path / "events.jsonl"
+        ProgressEventLog(path).emit(0.5)
+        assert not path.exists()
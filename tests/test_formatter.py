@@ -1,10 +1,13 @@
 """Tests for hark.formatter module."""
 
+import io
+
 import pytest
 
-from hark.constants import UNKNOWN_LANGUAGE_PROBABILITY
+from hark.constants import UNKNOWN_LANGUAGE_PROBABILITY, VALID_OUTPUT_FORMATS
 from hark.diarizer import DiarizationResult
 from hark.formatter import (
+    _FORMATTERS,
     MarkdownFormatter,
     OutputFormatter,
     PlainFormatter,
@@ -194,6 +197,11 @@ class TestSRTFormatter:
         assert SRTFormatter._format_srt_time(65.123) == "00:01:05,123"
         assert SRTFormatter._format_srt_time(3661.5) == "01:01:01,500"
 
+    def test_format_srt_time_rounds_into_next_second(self) -> None:
+        """Millisecond rounding should carry into seconds and minutes."""
+        assert SRTFormatter._format_srt_time(59.9996) == "00:01:00,000"
+        assert PlainFormatter._format_time(59.9996) == "01:00.000"
+
     def test_long_duration_hours(self, long_transcription_result: TranscriptionResult) -> None:
         """Should handle durations > 1 hour."""
         formatter = SRTFormatter()
@@ -244,6 +252,10 @@ class TestGetFormatter:
         assert isinstance(formatter, SRTFormatter)
         # SRTFormatter always includes timestamps
 
+    def test_registry_matches_valid_output_formats(self) -> None:
+        """Every valid output format should have a registered formatter."""
+        assert list(_FORMATTERS) == VALID_OUTPUT_FORMATS
+
 
 class TestOutputFormatterBase:
     """Tests for OutputFormatter base class."""
@@ -259,6 +271,22 @@ class TestOutputFormatterBase:
         assert issubclass(MarkdownFormatter, OutputFormatter)
         assert issubclass(SRTFormatter, OutputFormatter)
 
+    @pytest.mark.parametrize("format_name", ["plain", "markdown", "srt"])
+    @pytest.mark.parametrize("include_timestamps", [False, True])
+    def test_format_to_matches_format(
+        self,
+        format_name: str,
+        include_timestamps: bool,
+        sample_transcription_result: TranscriptionResult,
+        sample_diarization_result: DiarizationResult,
+    ) -> None:
+        """format_to should write exactly what format returns."""
+        formatter = get_formatter(format_name, include_timestamps=include_timestamps)
+        for result in (sample_transcription_result, sample_diarization_result):
+            buf = io.StringIO()
+            formatter.format_to(result, buf)
+            assert buf.getvalue() == formatter.format(result)
+
 
 class TestEdgeCases:
     """Tests for edge cases in formatting."""
@@ -274,6 +274,25 @@ class TestKeypressHandler:
                                 result = handler.get_key()
                                 assert result == "a"
 
+    def test_get_key_none_timeout_blocks_in_select(self) -> None:
+        """get_key(timeout=None) should block in select() rather than poll."""
+        mock_stdin = MagicMock()
+        mock_stdin.isatty.return_value = True
+        mock_stdin.fileno.return_value = 0
+        mock_stdin.read.return_value = " "
+
+        with patch.object(sys, "stdin", mock_stdin):
+            with patch("termios.tcgetattr", return_value=[]):
+                with patch("termios.tcsetattr"):
+                    with patch("tty.setcbreak"):
+                        with patch(
+                            "select.select", return_value=([mock_stdin], [], [])
+                        ) as mock_select:
+                            with KeypressHandler() as handler:
+                                result = handler.get_key(timeout=None)
+                                assert result == " "
+                                mock_select.assert_called_once_with([mock_stdin], [], [], None)
+
     def test_flush_input_non_tty(self) -> None:
         """flush_input should do nothing for non-TTY."""
         mock_stdin = io.StringIO()
@@ -500,6 +519,26 @@ class TestWindowsKeypressHandler:
                 result = handler.get_key(timeout=0.05)
                 assert result is None
 
+    def test_handler_get_key_windows_no_timeout_polls(self, mock_msvcrt) -> None:
+        """get_key(timeout=None) should keep polling kbhit() on Windows."""
+        mock_msvcrt.kbhit.side_effect = [False, False, True]
+        mock_msvcrt.getwch.return_value = " "
+
+        mock_stdin = MagicMock()
+        mock_stdin.isatty.return_value = True
+
+        import hark.keypress as keypress_module
+
+        with (
+            patch.object(keypress_module, "is_windows", return_value=True),
+            patch.object(keypress_module, "msvcrt", mock_msvcrt, create=True),
+            patch.object(sys, "stdin", mock_stdin),
+        ):
+            with KeypressHandler() as handler:
+                assert handler.get_key(timeout=None) == " "
+                assert mock_msvcrt.kbhit.call_count == 3
+                mock_msvcrt.getwch.assert_called_once()
+
     def test_handler_flush_input_windows(self, mock_msvcrt) -> None:
         """flush_input should consume pending keys on Windows."""
         # Simulate 3 pending keys then none
@@ -261,6 +261,20 @@ class TestAudioPreprocessor:
             preprocessor.process(temp_audio_file, 16000)
             mock_read.assert_called_once()
 
+    def test_accepts_in_memory_audio(self, disabled_config: PreprocessingConfig) -> None:
+        """Should use an in-memory recording without reading a file."""
+        recording = np.full((16000, 1), 0.25, dtype=np.float32)
+
+        with patch("soundfile.read") as mock_read:
+            preprocessor = AudioPreprocessor(disabled_config)
+            audio, result = preprocessor.process(recording, 16000)
+
+        mock_read.assert_not_called()
+        assert audio.shape == (16000,)
+        assert result.original_duration == 1.0
+        # Processing must not alias the recorder's buffer
+        assert not np.shares_memory(audio, recording)
+
     def test_converts_stereo_to_mono(
         self, temp_audio_file: Path, full_config: PreprocessingConfig
     ) -> None:
@@ -108,6 +108,12 @@ class TestUIQuietMode:
         captured = capsys.readouterr()
         assert captured.out == ""
 
+    def test_preprocessing_steps_quiet(self, quiet_ui: UI, capsys) -> None:
+        """preprocessing_steps should produce no output in quiet mode."""
+        quiet_ui.preprocessing_steps(["Noise reduction"])
+        captured = capsys.readouterr()
+        assert captured.out == ""
+
     def test_preprocessing_step_quiet(self, quiet_ui: UI, capsys) -> None:
         """preprocessing_step should produce no output in quiet mode."""
         quiet_ui.preprocessing_step("Noise reduction")
@@ -204,6 +210,21 @@ class TestUIOutput:
         assert "Test error" in captured.err
         assert captured.out == ""
 
+    def test_errors_single_write(self, ui: UI) -> None:
+        """errors should write all messages to stderr in one call."""
+        with patch("builtins.print") as mock_print:
+            ui.errors(["First", "Second"])
+
+        mock_print.assert_called_once()
+        assert mock_print.call_args.args[0] == "Error: First\nError: Second"
+        assert mock_print.call_args.kwargs["file"] is sys.stderr
+
+    def test_errors_empty_prints_nothing(self, ui: UI, capsys) -> None:
+        """errors with no messages should print nothing."""
+        ui.errors([])
+        captured = capsys.readouterr()
+        assert captured.err == ""
+
 
 class TestUIFormatDuration:
     """Tests for _format_duration method."""
@@ -443,6 +464,15 @@ class TestUIPreprocessingStep:
         captured = capsys.readouterr()
         assert "Noise reduction" in captured.out
 
+    def test_preprocessing_steps_matches_individual_steps(self, ui: UI, capsys) -> None:
+        """preprocessing_steps should print the same lines as repeated preprocessing_step."""
+        ui.preprocessing_step("Noise reduction")
+        ui.preprocessing_step("Audio normalized")
+        individual = capsys.readouterr().out
+
+        ui.preprocessing_steps(["Noise reduction", "Audio normalized"])
+        assert capsys.readouterr().out == individual
+
 
 class TestUIVerbose:
     """Tests for verbose method."""